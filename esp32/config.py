@@ -13,6 +13,7 @@ PIN_BOOT_BUTTON = 0
 
 # MFRC522 读卡器引脚配置
 # (sck=5, mosi=6, miso=7 是共享的 SPI 总线)
+# 可选 "irq": 读卡器 IRQ 引脚，配置后异步收发由中断唤醒，不再通过 SPI 轮询 ComIrqReg
 READER_PINS = [
     {"rst": 15, "cs": 4},  # 读卡器 1
     {"rst": 3, "cs": 16},  # 读卡器 2
@@ -20,6 +21,18 @@ READER_PINS = [
     {"rst": 35, "cs": 38}, # 读卡器 4
 ]
 READER_SPI_SHARED = {"sck": 5, "mosi": 6, "miso": 7}
+READER_SPI_ID = 1                # 所有读卡器共用的硬件 SPI 外设
+READER_SPI_SAFE_BAUDRATE = 100000 # 校准前/链路校验失败时使用的时钟
+# SPI 时钟校准: 逐级升频 (MFRC522 最高 10 MHz)，取无误码的最高一级再降 MARGIN 级
+READER_SPI_CLOCK_STEPS = [1000000, 2000000, 4000000, 5000000, 8000000, 10000000]
+READER_SPI_CLOCK_MARGIN = 1
+READER_SPI_CALIBRATION_ROUNDS = 16
+# 射频参数校准 (nfc_reader.calibrate_rf，通过 MQTT {nfc_mqtt_topic_base}/calibrate 触发)
+READER_RF_RX_GAINS = [4, 5, 6, 7, 3, 2] # RFCfgReg RxGain 代码: 33/38/43/48/23/18 dB
+READER_RF_MOD_WIDTHS = [0x26, 0x20, 0x2C] # ModWidthReg 候选值 (0x26 为复位值)
+READER_RF_CALIBRATION_ROUNDS = 10 # 每组设置的读取次数
+READER_RF_LATENCY_MARGIN_MS = 3 # 成功次数相同时，平均耗时至少快这么多才换掉先测的设置
+READER_HW_CRC = True  # SELECT 之后由芯片硬件追加/校验 CRC_A，省去 CalcCRC 往返
 
 # --- 3. 网络配置 ---
 CONFIG_FILE = "config.json"
@@ -29,9 +42,35 @@ AP_NETMASK = "255.255.255.0"
 
 # --- 4. 异步任务与循环延时 ---
 BUTTON_CHECK_MS = 50       # 按钮检查间隔
-NFC_LOOP_DELAY_MS = 1500   # NFC 轮询间隔
 DHT_READ_INTERVAL_S = 10   # DHT 读取间隔
-NFC_MAX_READ_FAILURES = 200 # NFC 标签移除确认阈值
+# 槽位去抖 (slot_state.SlotState): 在位标签无应答后立即突发重探测，
+# 确认窗口内始终无应答 (且至少 NFC_BURST_PROBES 次) 才发布空盘
+NFC_BURST_PROBES = 3          # 突发重探测次数
+NFC_BURST_INTERVAL_MS = 50    # 突发重探测间隔
+NFC_REMOVAL_CONFIRM_MS = 3000 # 移除确认窗口
+# 各槽位独立的 NFC 轮询间隔 (poll_scheduler.PollScheduler):
+# 档位名 -> (下限 floor, 上限 ceiling) ms。变化/疑似移除后用下限，稳定后逐步翻倍到上限。
+# 档位由 printer_state_topic 上的打印机状态 (档位名) 切换
+NFC_POLL_PROFILES = {
+    "idle": (500, 5000),
+    "printing": (5000, 30000),
+    "changing_filament": (200, 1000),
+}
+NFC_POLL_DEFAULT_PROFILE = "idle"
+NFC_CACHE_REVALIDATE_MS = 60000 # UID 未变化时，强制完整重读 NDEF 的间隔
+# 页读取失败的重试策略: 失败类别 -> (重试次数, 首次退避 ms，之后每次翻倍)
+# 无应答说明标签已离开，直接放弃；NAK 后会先重新选中标签再重试
+NFC_READ_RETRY_POLICY = {
+    "no_response": (0, 0),
+    "crc": (3, 5),
+    "nak": (1, 10),
+    "collision": (2, 20),
+    "other": (2, 10),
+}
+NFC_READ_METRIC_INTERVAL_S = 60 # 发布最长单次读取耗时指标 ({nfc_mqtt_topic_base}/read_ms) 的间隔
+NFC_SUPERVISOR_CHECK_MS = 1000  # 检查/重启槽位轮询任务的间隔
+TAG_STATION_POLL_MS = 200  # 标签编程站检查新标签的间隔
+MQTT_CHECK_MS = 200  # 检查并分发 MQTT 订阅消息 (打印机状态、校准、编程站命令) 的间隔
 
 # --- 5. 默认配置 ---
 DEFAULT_CONFIG = {
@@ -45,6 +84,9 @@ DEFAULT_CONFIG = {
     "mqtt_client_id": "ams-sensor",
     "mqtt_topic_temp": "ams_sensor/temperature",
     "mqtt_topic_humidity": "ams_sensor/humidity",
+    "printer_state_topic": "",  # 可选: 打印机状态 (idle/printing/changing_filament)，用于切换轮询档位
+    "reader_spi_baudrates": [],  # 各读卡器校准后的 SPI 时钟，为空时启动时校准
+    "reader_rf_settings": [],  # 各读卡器校准后的射频参数 [rx_gain, mod_width]，为空时使用芯片默认值
 }
 
 # --- 6. 配置管理函数 ---
@@ -123,12 +123,17 @@ def start_config_server(current_config, display_module, check_button_func):
                         "mqtt_topic_humidity": params.get(
                             "mqtt_topic_humidity", config.DEFAULT_CONFIG["mqtt_topic_humidity"]
                         ),
+                        "printer_state_topic": params.get("printer_state_topic", ""),
                     })
                     try:
                         new_config["mqtt_port"] = int(params.get("mqtt_port", config.DEFAULT_CONFIG["mqtt_port"]))
                     except ValueError:
                         new_config["mqtt_port"] = config.DEFAULT_CONFIG["mqtt_port"]
-                    
+                    # 表单里没有的设备校准结果 (SPI 时钟、射频参数) 原样保留
+                    for key in ("reader_spi_baudrates", "reader_rf_settings"):
+                        if key in current_config:
+                            new_config[key] = current_config[key]
+
                     config.save_config(new_config) # 使用 config 模块的函数
 
                     html_success = """
@@ -201,6 +206,7 @@ def start_config_server(current_config, display_module, check_button_func):
 
                             <h4>Topic 设置 (NFC/料盘)</h4>
                             <div><label for="nfc_mqtt_topic_base">NFC Topic (Base):</label><input type="text" id="nfc_mqtt_topic_base" name="nfc_mqtt_topic_base" value="{current_config.get('nfc_mqtt_topic_base', 'ams_sensor/nfc')}"></div>
+                            <div><label for="printer_state_topic">打印机状态 Topic (可选):</label><input type="text" id="printer_state_topic" name="printer_state_topic" value="{current_config.get('printer_state_topic', '')}"></div>
                         </details>
 
                         <br>
@@ -1,5 +1,6 @@
 import gc
 import time
+import ujson
 
 import machine
 
@@ -15,100 +16,202 @@ import display
 import hardware
 import network_manager
 import nfc_reader
+import poll_scheduler
+import slot_state
+import tag_station
 
 
-async def task_nfc_loop(readers, config_data):
+async def task_nfc_slot(i, reader_obj, scheduler, wake, topic, read_ms, calibrate, config_data):
     """
-    异步任务：轮询 NFC 读卡器。
+    (Async Task) 单个槽位的 NFC 轮询任务，拥有独立的 SlotState 和轮询时间。
+    每次 SPI 传输 (SPIBus.transfer) 在协作式调度下是原子的，总线不需要锁；
+    同一读卡器上的完整操作 (唤醒 -> 读取 -> 休眠、校准、编程站写入) 由该读卡器的
+    MFRC522.exchange 锁串行化。一个读卡器等待射频应答或重试时，其他槽位照常轮询。
+    SlotState 按时间去抖: 在位标签无应答时立即突发重探测，
+    NFC_REMOVAL_CONFIRM_MS 内始终无应答才发布空盘；换料 (读到不同 ID) 立即发布。
+    calibrate[i] 被置位时先对本槽位做射频参数校准 (需放参考标签)，结果保存到 config.json。
+    异常会结束本任务，由 task_nfc_supervisor 重启。
+    """
+    slot_number = i + 1
+    state = slot_state.SlotState(config.NFC_REMOVAL_CONFIRM_MS, config.NFC_BURST_PROBES)
+
+    local_set_led = hardware.set_led
+    local_read = nfc_reader.read_tag_text
+    local_publish = network_manager.try_publish_mqtt
+
+    try:
+        while True:
+            if calibrate[i]:
+                calibrate[i] = False
+                print(f"Slot {slot_number}: 开始射频参数校准...")
+                (settings, result) = await nfc_reader.calibrate_rf(reader_obj)
+                if settings:
+                    print(f"Slot {slot_number}: 射频参数 RxGain={settings[0]} ModWidth=0x{settings[1]:02X} ({result})")
+                    nfc_reader.save_rf_settings(config_data, i, settings)
+                    result["rx_gain"], result["mod_width"] = settings
+                else:
+                    print(f"!!!!! 错误: Slot {slot_number} 射频校准失败: 所有设置都读不到参考标签 !!!!!")
+                    result = {"ok": 0}
+                local_publish(f"{topic}/rf_calibration", ujson.dumps(result))
+
+            if tag_station.active_slot() == slot_number:
+                # 编程站槽位由 task_tag_station 负责，保持原有状态
+                scheduler.record(i, time.ticks_ms(), False, False)
+            else:
+                local_set_led(255, 255, 0)  # 调用局部变量 (黄色)
+                start_ms = time.ticks_ms()
+                detected_text = await local_read(reader_obj)
+                now = time.ticks_ms()
+                read_ms[i] = max(read_ms[i], time.ticks_diff(now, start_ms))
+                local_set_led(0, 255, 0)  # 调用局部变量 (绿色)
+
+                was_suspect = state.suspect
+                value = state.update(detected_text, now)
+                if value is None and state.suspect and not was_suspect:
+                    # 疑似移除: 立即突发重探测，标签重新应答即退出
+                    if config.DEBUG:
+                        print(f"DEBUG: Slot {slot_number}: 标签无应答，疑似移除，开始突发重探测")
+                    for _ in range(config.NFC_BURST_PROBES):
+                        await uasyncio.sleep_ms(config.NFC_BURST_INTERVAL_MS)
+                        detected_text = await local_read(reader_obj)
+                        value = state.update(detected_text, time.ticks_ms())
+                        if value is not None or not state.suspect:
+                            break
+
+                if value is not None:
+                    if config.DEBUG:
+                        print(f"DEBUG: Slot {slot_number}: *** 状态变更 *** ID: '{value}'")
+                    local_publish(topic, value)
+                scheduler.record(i, time.ticks_ms(), value is not None, state.suspect)
+
+            # 非阻塞休眠；打印机状态切换档位时提前唤醒
+            wake.clear()
+            try:
+                await uasyncio.wait_for_ms(wake.wait(), scheduler.sleep_ms(i, time.ticks_ms()))
+            except uasyncio.TimeoutError:
+                pass
+    except Exception as e:
+        print(f"!!!!! 错误: Slot {slot_number} 轮询任务异常 (错误类型: {type(e).__name__}): {e} !!!!!")
+
+
+async def task_nfc_supervisor(readers, config_data):
+    """
+    (Async Task) 异步任务：为每个读卡器启动独立的轮询任务 (task_nfc_slot) 并监督它们。
+    槽位任务异常退出后重新初始化该读卡器并重启任务，其他槽位不受影响，无需重启开发板。
+    各槽位的轮询间隔由 PollScheduler 独立调整: 变化或疑似移除后加快，长期稳定后放慢；
+    可选的打印机状态 Topic (printer_state_topic) 切换 NFC_POLL_PROFILES 中的档位。
     """
     if config.DEBUG:
-        print("DEBUG: (Async) NFC 轮询任务已启动。")
+        print("DEBUG: (Async) NFC 监督任务已启动。")
 
     reader_count = len(readers)
-    current_slot_states = [""] * reader_count
-    slot_miss_counters = [0] * reader_count
-    is_first_loop = True
+    scheduler = poll_scheduler.PollScheduler(
+        reader_count, config.NFC_POLL_PROFILES, config.NFC_POLL_DEFAULT_PROFILE, time.ticks_ms()
+    )
+    wakes = [uasyncio.Event() for _ in range(reader_count)]
+    read_ms = [0] * reader_count
+    calibrate = [False] * reader_count
+
+    def on_printer_state(topic, msg):
+        state = msg.decode().strip().lower()
+        if scheduler.set_profile(state, time.ticks_ms()):
+            if config.DEBUG:
+                print(f"DEBUG: 打印机状态 '{state}'，NFC 轮询间隔 {scheduler.floor}-{scheduler.ceiling}ms")
+            for wake in wakes:
+                wake.set()
+        elif state not in config.NFC_POLL_PROFILES:
+            print(f"  [!] 未知的打印机状态: '{state}'")
+
+    printer_state_topic = config_data.get("printer_state_topic")
+    if printer_state_topic:
+        network_manager.subscribe_mqtt(printer_state_topic, on_printer_state)
 
     nfc_topic_base = config_data.get("nfc_mqtt_topic_base")
 
+    def on_calibrate(topic, msg):
+        # 负载为槽位号 (从 1 开始)
+        try:
+            slot = int(msg)
+        except ValueError:
+            slot = 0
+        if not 1 <= slot <= reader_count:
+            print(f"  [!] 射频校准: 槽位 '{msg}' 无效")
+            return
+        calibrate[slot - 1] = True
+        wakes[slot - 1].set()
+
+    network_manager.subscribe_mqtt(f"{nfc_topic_base}/calibrate", on_calibrate)
+
     nfc_topics = [f"{nfc_topic_base}/slot_{i+1}" for i in range(reader_count)]
+    read_metric_topic = f"{nfc_topic_base}/read_ms"
+    last_metric_ms = time.ticks_ms()
 
-    local_set_led = hardware.set_led
-    local_read_tag = nfc_reader.read_tag_text
-    local_publish = network_manager.try_publish_mqtt
+    tasks = [None] * reader_count
+    restarts = [0] * reader_count
 
     while True:
-        if config.DEBUG:
-            print(f"\nDEBUG: --- (Async) RFID 循环开始 (Time: {time.time()}) ---")
+        for i in range(reader_count):
+            task = tasks[i]
+            if task is not None and not task.done():
+                continue
+            if task is not None:
+                restarts[i] += 1
+                print(f"!!!!! 错误: Slot {i+1} 轮询任务已退出，正在重启 (第 {restarts[i]} 次) !!!!!")
+                try:
+                    readers[i].init()
+                except Exception as e:
+                    print(f"!!!!! 错误: Slot {i+1} 读卡器重新初始化失败: {e} !!!!!")
+            tasks[i] = uasyncio.create_task(
+                task_nfc_slot(i, readers[i], scheduler, wakes[i], nfc_topics[i], read_ms, calibrate, config_data)
+            )
 
-        local_set_led(0, 255, 0)  # 调用局部变量 (绿色)
+        if time.ticks_diff(time.ticks_ms(), last_metric_ms) >= config.NFC_READ_METRIC_INTERVAL_S * 1000:
+            last_metric_ms = time.ticks_ms()
+            network_manager.try_publish_mqtt(read_metric_topic, max(read_ms))
+            for i in range(reader_count):
+                stats = nfc_reader.failure_stats(readers[i])
+                if stats:
+                    network_manager.try_publish_mqtt(f"{nfc_topics[i]}/read_failures", ujson.dumps(stats))
+            for i in range(reader_count):
+                read_ms[i] = 0
 
-        for i in range(reader_count):
-            reader = readers[i]
-            slot_number = i + 1
-            if config.DEBUG:
-                print(f"DEBUG: 正在轮询 Slot {slot_number}...")
+        await uasyncio.sleep_ms(config.NFC_SUPERVISOR_CHECK_MS)
 
-            local_set_led(255, 255, 0)  # 调用局部变量 (黄色)
-            detected_text = local_read_tag(reader) 
-            local_set_led(0, 255, 0)  # 调用局部变量 (绿色)
 
-            if detected_text:
-                # 成功读到标签（ID），如果与当前记录不同或首次循环则更新并发布
-                if detected_text != current_slot_states[i] or is_first_loop:
-                    if config.DEBUG:
-                        print(
-                            f"DEBUG: Slot {slot_number}: *** 状态确认/变更 *** ID: '{detected_text}'"
-                        )
-                    current_slot_states[i] = detected_text
-                    slot_miss_counters[i] = 0
-                    # 发布已检测到的 ID
-                    local_publish(nfc_topics[i], detected_text)
-                else:
-                    # 读到同一标签，重置失败计数
-                    slot_miss_counters[i] = 0
+async def task_tag_station(readers, config_data):
+    """
+    (Async Task) 异步任务：标签编程站。
+    在编程站槽位上逐张写入队列中的耗材 ID (命令由 task_mqtt_check 分发)。
+    """
+    if config.DEBUG:
+        print("DEBUG: (Async) 标签编程站任务已启动。")
 
-            else:
-                # 没有读到标签
-                if current_slot_states[i] == "":
-                    # 本来就是空盘，且不是首次循环，不需要任何操作
-                    if is_first_loop:
-                        # 首次循环时仍然发布空状态以完成初始化
-                        if config.DEBUG:
-                            print(
-                                f"DEBUG: Slot {slot_number}: 首次循环，发布空状态初始化"
-                            )
-                        local_publish(nfc_topics[i], "")
-                else:
-                    # 之前有标签，现在读不到，增加失败计数；达到阈值后才发布空盘
-                    slot_miss_counters[i] += 1
-                    if config.DEBUG:
-                        print(
-                            f"DEBUG: Slot {slot_number}: 未扫到标签, 失败计数: {slot_miss_counters[i]}/{config.NFC_MAX_READ_FAILURES}"
-                        )
-
-                    if slot_miss_counters[i] >= config.NFC_MAX_READ_FAILURES:
-                        if config.DEBUG:
-                            print(
-                                f"DEBUG: Slot {slot_number}: --- 标签移除 (已确认) ---"
-                            )
-                        current_slot_states[i] = ""
-                        slot_miss_counters[i] = 0
-                        # 发布空盘状态
-                        local_publish(nfc_topics[i], "")
-
-        if is_first_loop:
-            if config.DEBUG:
-                print("DEBUG: ===== 首次启动循环完成, 恢复正常轮询模式 =====")
-            is_first_loop = False
+    tag_station.init(config_data)
 
-        if config.DEBUG:
-            print(
-                f"DEBUG: --- (Async) RFID 循环结束，休眠 {config.NFC_LOOP_DELAY_MS}ms ---"
-            )
+    local_step = tag_station.step
 
-        # 非阻塞休眠
-        await uasyncio.sleep_ms(config.NFC_LOOP_DELAY_MS)
+    while True:
+        try:
+            await local_step(readers)
+        except Exception as e:
+            print(f"!!!!! 错误: 标签编程站异常: {e} !!!!!")
+
+        await uasyncio.sleep_ms(config.TAG_STATION_POLL_MS)
+
+
+async def task_mqtt_check():
+    """
+    (Async Task) 异步任务：检查 MQTT 订阅消息并分发给各模块注册的回调。
+    """
+    if config.DEBUG:
+        print("DEBUG: (Async) MQTT 消息检查任务已启动。")
+
+    local_check_msg = network_manager.check_mqtt_msg
+
+    while True:
+        local_check_msg()
+
+        await uasyncio.sleep_ms(config.MQTT_CHECK_MS)
 
 
 async def task_dht_loop(dht_sensor_instance, config_data):
@@ -195,7 +298,7 @@ def main():
         network_manager.connect_mqtt(display_module=display)
 
         # 初始化传感器
-        readers = nfc_reader.init_readers()
+        readers = nfc_reader.init_readers(config_data)
         dht_sensor_instance = dht_sensor.init_dht()
 
         if not readers:
@@ -210,8 +313,10 @@ def main():
             try:
                 loop = uasyncio.get_event_loop()
                 # 创建任务
-                loop.create_task(task_nfc_loop(readers, config_data))
+                loop.create_task(task_nfc_supervisor(readers, config_data))
                 loop.create_task(task_dht_loop(dht_sensor_instance, config_data))
+                loop.create_task(task_tag_station(readers, config_data))
+                loop.create_task(task_mqtt_check())
                 loop.create_task(task_button_check())
                 # 启动事件循环
                 if config.DEBUG:
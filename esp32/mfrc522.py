@@ -1,5 +1,9 @@
-from machine import Pin, SPI
-from os import uname
+from machine import Pin
+import time
+
+import uasyncio
+
+from spi_bus import SPIBus
 
 
 class MFRC522:
@@ -10,49 +14,138 @@ class MFRC522:
 
 	REQIDL = 0x26
 	REQALL = 0x52
+
+	# ISO14443A anticollision/SELECT cascade levels
+	SEL_CL1 = 0x93
+	SEL_CL2 = 0x95
+	SEL_CL3 = 0x97
+	CASCADE_LEVELS = (SEL_CL1, SEL_CL2, SEL_CL3)
+
+	# Final SAK -> tag family
+	TAG_TYPE2 = 'type2'  # NTAG21x / MIFARE Ultralight
+	SAK_TAG_TYPES = {
+		0x00: TAG_TYPE2,
+		0x08: 'classic_1k',
+		0x09: 'classic_mini',
+		0x18: 'classic_4k',
+		0x20: 'iso14443_4',
+	}
+
+	# Failure class of the last exchange (last_failure)
+	FAIL_NONE = None
+	FAIL_NO_RESPONSE = 'no_response'
+	FAIL_CRC = 'crc'
+	FAIL_NAK = 'nak'
+	FAIL_COLLISION = 'collision'
+	FAIL_OTHER = 'other'
+
 	AUTHENT1A = 0x60
 	AUTHENT1B = 0x61
 
-	def __init__(self, sck, mosi, miso, rst, cs):
+	FIFO_SIZE = 64
+	# FAST_READ reply (4 bytes/page + CRC_A) must fit in the FIFO
+	FAST_READ_MAX_PAGES = (FIFO_SIZE - 2) // 4
+
+	# Deadline for the async transceive; the chip timer (TReloadReg) fires after ~15 ms
+	TRANSCEIVE_TIMEOUT_MS = 25
+
+	# RFCfgReg (0x26) bits 6:4 RxGain: 0..7 = 18, 23, 18, 23, 33, 38, 43, 48 dB
+	RX_GAIN_DEFAULT = 4
+	# ModWidthReg (0x24) reset value
+	MOD_WIDTH_DEFAULT = 0x26
+
+	# ComIEnReg sources routed to the IRQ pin: RxIEn | IdleIEn | TimerIEn
+	IRQ_PIN_MASK = 0x31
+
+	# Write/read-back patterns for the SPI link check on ModWidthReg
+	LINK_PATTERNS = (0x55, 0xAA, 0x00, 0xFF, 0x3C, 0xC3)
+
+	def __init__(self, sck, mosi, miso, rst, cs, hw_crc=False, irq=None, bus=None, baudrate=None, rx_gain=None, mod_width=None):
+
+		self.hw_crc = hw_crc
+		self.rx_gain = self.RX_GAIN_DEFAULT if rx_gain is None else rx_gain
+		self.mod_width = self.MOD_WIDTH_DEFAULT if mod_width is None else mod_width
+		self.spi_ops = 0
+		self.last_failure = self.FAIL_NONE
+		self._crc_on = False
+		# Held for a whole multi-frame exchange (wake/select/read/halt) so that
+		# two tasks sharing this reader never interleave frames on the chip
+		self.exchange = uasyncio.Lock()
+
+		# Preallocated SPI buffers: register access and FIFO bursts allocate nothing
+		self._reg_tx = bytearray(2)
+		self._reg_rx = bytearray(2)
+		self._fifo_tx = bytearray(self.FIFO_SIZE + 1)
+		self._fifo_tx[0] = 0x12
+		self._fifo_rd = bytearray(b'\x92' * (self.FIFO_SIZE + 1))
+		self._fifo_rx = bytearray(self.FIFO_SIZE + 1)
+		self._fifo_tx_mv = memoryview(self._fifo_tx)
+		self._fifo_rd_mv = memoryview(self._fifo_rd)
+		self._fifo_rx_mv = memoryview(self._fifo_rx)
 
-		self.sck = Pin(sck, Pin.OUT)
-		self.mosi = Pin(mosi, Pin.OUT)
-		self.miso = Pin(miso)
 		self.rst = Pin(rst, Pin.OUT)
-		self.cs = Pin(cs, Pin.OUT)
+
+		self.irq = None
+		self._irq_flag = None
+		if irq is not None:
+			# ComIEnReg IRqInv is set, so the IRQ line is active low
+			self.irq = Pin(irq, Pin.IN, Pin.PULL_UP)
+			self._irq_flag = uasyncio.ThreadSafeFlag()
+			self.irq.irq(trigger=Pin.IRQ_FALLING, handler=self._on_irq)
 
 		self.rst.value(0)
-		self.cs.value(1)
-		
-		board = uname()[0]
-
-		if board == 'WiPy' or board == 'LoPy' or board == 'FiPy':
-			self.spi = SPI(0)
-			self.spi.init(SPI.MASTER, baudrate=1000000, pins=(self.sck, self.mosi, self.miso))
-		elif board == 'esp8266' or board == 'esp32':
-			self.spi = SPI(baudrate=100000, polarity=0, phase=0, sck=self.sck, mosi=self.mosi, miso=self.miso)
-			self.spi.init()
-		else:
-			raise RuntimeError("Unsupported platform")
+
+		# Readers sharing sck/mosi/miso should be given one SPIBus; it owns CS
+		if bus is None:
+			bus = SPIBus(sck, mosi, miso)
+		self.bus = bus
+		self.baudrate = baudrate if baudrate else bus.baudrate
+		bus.attach(self, cs)
 
 		self.rst.value(1)
 		self.init()
 
+	def _on_irq(self, pin):
+		self._irq_flag.set()
+
 	def _wreg(self, reg, val):
 
-		self.cs.value(0)
-		self.spi.write(b'%c' % int(0xff & ((reg << 1) & 0x7e)))
-		self.spi.write(b'%c' % int(0xff & val))
-		self.cs.value(1)
+		tx = self._reg_tx
+		tx[0] = (reg << 1) & 0x7e
+		tx[1] = val & 0xff
+		self.spi_ops += 1
+		self.bus.transfer(self, tx)
 
 	def _rreg(self, reg):
 
-		self.cs.value(0)
-		self.spi.write(b'%c' % int(0xff & (((reg << 1) & 0x7e) | 0x80)))
-		val = self.spi.read(1)
-		self.cs.value(1)
+		tx = self._reg_tx
+		tx[0] = ((reg << 1) & 0x7e) | 0x80
+		tx[1] = 0
+		self.spi_ops += 1
+		self.bus.transfer(self, tx, self._reg_rx)
 
-		return val[0]
+		return self._reg_rx[1]
+
+	def _wfifo(self, data):
+
+		# Burst write into FIFODataReg: address byte followed by all data bytes
+		n = len(data)
+		tx = self._fifo_tx
+		for i in range(n):
+			tx[i + 1] = data[i]
+		self.spi_ops += 1
+		self.bus.transfer(self, self._fifo_tx_mv[:n + 1])
+
+	def _rfifo(self, n):
+
+		# Repeated-address burst read of FIFODataReg, terminated by 0x00
+		rd = self._fifo_rd
+		rd[n] = 0x00
+		self.spi_ops += 1
+		self.bus.transfer(self, self._fifo_rd_mv[:n + 1], self._fifo_rx_mv[:n + 1])
+		rd[n] = 0x92
+
+		return self._fifo_rx[1:n + 1]
 
 	def _sflags(self, reg, mask):
 		self._wreg(reg, self._rreg(reg) | mask)
@@ -60,11 +153,9 @@ class MFRC522:
 	def _cflags(self, reg, mask):
 		self._wreg(reg, self._rreg(reg) & (~mask))
 
-	def _tocard(self, cmd, send):
+	def _tocard_start(self, cmd, send):
 
-		recv = []
-		bits = irq_en = wait_irq = n = 0
-		stat = self.ERR
+		irq_en = wait_irq = 0
 
 		if cmd == 0x0E:
 			irq_en = 0x12
@@ -73,33 +164,37 @@ class MFRC522:
 			irq_en = 0x77
 			wait_irq = 0x30
 
-		self._wreg(0x02, irq_en | 0x80)
+		self._wreg(0x02, (irq_en & self.IRQ_PIN_MASK) | 0x80)
 		self._cflags(0x04, 0x80)
 		self._sflags(0x0A, 0x80)
 		self._wreg(0x01, 0x00)
 
-		for c in send:
-			self._wreg(0x09, c)
+		self._wfifo(send)
 		self._wreg(0x01, cmd)
 
 		if cmd == 0x0C:
 			self._sflags(0x0D, 0x80)
 
-		i = 2000
-		while True:
-			n = self._rreg(0x04)
-			i -= 1
-			if ~((i != 0) and ~(n & 0x01) and ~(n & wait_irq)):
-				break
+		return irq_en, wait_irq
+
+	def _tocard_end(self, cmd, irq_en, n, done):
+
+		recv = b''
+		bits = 0
+		stat = self.ERR
+		self.last_failure = self.FAIL_NO_RESPONSE
 
 		self._cflags(0x0D, 0x80)
 
-		if i:
-			if (self._rreg(0x06) & 0x1B) == 0x00:
+		if done:
+			err = self._rreg(0x06) & (0x1F if self._crc_on else 0x1B)
+			if err == 0x00:
 				stat = self.OK
+				self.last_failure = self.FAIL_NONE
 
 				if n & irq_en & 0x01:
 					stat = self.NOTAGERR
+					self.last_failure = self.FAIL_NO_RESPONSE
 				elif cmd == 0x0C:
 					n = self._rreg(0x0A)
 					lbits = self._rreg(0x0C) & 0x07
@@ -110,26 +205,83 @@ class MFRC522:
 
 					if n == 0:
 						n = 1
-					elif n > 16:
-						n = 16
+					elif n > self.FIFO_SIZE:
+						n = self.FIFO_SIZE
 
-					for _ in range(n):
-						recv.append(self._rreg(0x09))
+					recv = self._rfifo(n)
 			else:
 				stat = self.ERR
+				self.last_failure = self._classify_error(err)
 
 		return stat, recv, bits
 
-	def _crc(self, data):
+	def _classify_error(self, err):
+
+		# ErrorReg: CollErr 0x08, CRCErr 0x04, ParityErr 0x02, ProtocolErr 0x01
+		if err & 0x08:
+			return self.FAIL_COLLISION
+		if err == 0x04 and self._rreg(0x0A) == 1 and (self._rreg(0x0C) & 0x07) == 4:
+			# A 4-bit ACK/NAK carries no CRC_A, so RxCRCEn flags it
+			return self.FAIL_NAK
+		if err & 0x06:
+			return self.FAIL_CRC
+		return self.FAIL_OTHER
+
+	def _tocard(self, cmd, send):
+
+		(irq_en, wait_irq) = self._tocard_start(cmd, send)
+
+		# Stop on Rx/Idle or the chip's timer IRQ, as _tocard_async does
+		i = 2000
+		while True:
+			n = self._rreg(0x04)
+			i -= 1
+			if n & (wait_irq | 0x01) or i == 0:
+				break
+
+		return self._tocard_end(cmd, irq_en, n, n & (wait_irq | 0x01))
+
+	async def _tocard_async(self, cmd, send):
+
+		flag = self._irq_flag
+		if flag is not None:
+			flag.clear()
+		(irq_en, wait_irq) = self._tocard_start(cmd, send)
+
+		# Yield to the scheduler until Rx/Idle or the chip's timer IRQ fires;
+		# with an IRQ pin, sleep on the flag instead of polling ComIrqReg
+		deadline = time.ticks_add(time.ticks_ms(), self.TRANSCEIVE_TIMEOUT_MS)
+		while True:
+			n = self._rreg(0x04)
+			if n & (wait_irq | 0x01):
+				done = True
+				break
+			remaining = time.ticks_diff(deadline, time.ticks_ms())
+			if remaining <= 0:
+				done = False
+				break
+			if flag is None:
+				await uasyncio.sleep_ms(0)
+			else:
+				try:
+					await uasyncio.wait_for_ms(flag.wait(), remaining)
+				except uasyncio.TimeoutError:
+					pass
+
+		return self._tocard_end(cmd, irq_en, n, done)
+
+	def _crc_start(self, data):
 
 		self._cflags(0x05, 0x04)
 		self._sflags(0x0A, 0x80)
 
-		for c in data:
-			self._wreg(0x09, c)
-
+		self._wfifo(data)
 		self._wreg(0x01, 0x03)
 
+	def _crc(self, data):
+
+		self._crc_start(data)
+
 		i = 0xFF
 		while True:
 			n = self._rreg(0x05)
@@ -139,17 +291,88 @@ class MFRC522:
 
 		return [self._rreg(0x22), self._rreg(0x21)]
 
+	async def _crc_async(self, data):
+
+		self._crc_start(data)
+
+		deadline = time.ticks_add(time.ticks_ms(), self.TRANSCEIVE_TIMEOUT_MS)
+		while True:
+			if self._rreg(0x05) & 0x04:
+				break
+			if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+				break
+			await uasyncio.sleep_ms(0)
+
+		return [self._rreg(0x22), self._rreg(0x21)]
+
+	def _set_crc(self, on):
+
+		# TxModeReg/RxModeReg bit 7: append/check CRC_A in hardware
+		if on != self._crc_on:
+			self._wreg(0x12, 0x80 if on else 0x00)
+			self._wreg(0x13, 0x80 if on else 0x00)
+			self._crc_on = on
+
+	def set_baudrate(self, baudrate):
+
+		self.baudrate = baudrate
+		self.bus.release(self)
+
+	def version(self):
+		return self._rreg(0x37)
+
+	def link_errors(self, rounds=4, version=None):
+
+		# A floating or shorted MISO reads 0x00/0xFF; a marginal clock reads unstable values
+		if version is None:
+			version = self.version()
+			if version in (0x00, 0xFF):
+				return rounds * (len(self.LINK_PATTERNS) + 1)
+
+		errors = 0
+		for _ in range(rounds):
+			if self.version() != version:
+				errors += 1
+			for pattern in self.LINK_PATTERNS:
+				self._wreg(0x24, pattern)
+				if self._rreg(0x24) != pattern:
+					errors += 1
+
+		self._wreg(0x24, self.mod_width)
+		return errors
+
+	def link_ok(self, rounds=4):
+		return self.link_errors(rounds) == 0
+
 	def init(self):
 
 		self.reset()
+		self._crc_on = False
 		self._wreg(0x2A, 0x8D)
 		self._wreg(0x2B, 0x3E)
 		self._wreg(0x2D, 30)
 		self._wreg(0x2C, 0)
 		self._wreg(0x15, 0x40)
 		self._wreg(0x11, 0x3D)
+		self._apply_rf()
+		if self.irq is not None:
+			self._wreg(0x03, 0x80)  # DivIEnReg: IRQ pin push-pull
 		self.antenna_on()
 
+	def _apply_rf(self):
+
+		self._wreg(0x26, (self._rreg(0x26) & 0x8F) | ((self.rx_gain & 0x07) << 4))
+		self._wreg(0x24, self.mod_width)
+
+	def set_rf(self, rx_gain=None, mod_width=None):
+
+		# Receiver gain and modulation width, kept across init()
+		if rx_gain is not None:
+			self.rx_gain = rx_gain
+		if mod_width is not None:
+			self.mod_width = mod_width
+		self._apply_rf()
+
 	def reset(self):
 		self._wreg(0x01, 0x0F)
 
@@ -162,6 +385,7 @@ class MFRC522:
 
 	def request(self, mode):
 
+		self._set_crc(False)
 		self._wreg(0x0D, 0x07)
 		(stat, recv, bits) = self._tocard(0x0C, [mode])
 
@@ -170,13 +394,72 @@ class MFRC522:
 
 		return stat, bits
 
-	def anticoll(self):
+	async def request_async(self, mode):
 
-		ser_chk = 0
-		ser = [0x93, 0x20]
+		self._set_crc(False)
+		self._wreg(0x0D, 0x07)
+		(stat, recv, bits) = await self._tocard_async(0x0C, [mode])
+
+		if (stat != self.OK) | (bits != 0x10):
+			stat = self.ERR
+
+		return stat, bits
 
+	def wakeup(self):
+
+		# WUPA: wakes tags in IDLE and HALT state alike
+		return self.request(self.REQALL)
+
+	async def wakeup_async(self):
+
+		return await self.request_async(self.REQALL)
+
+	def _halt_frame(self):
+
+		self._set_crc(self.hw_crc)
 		self._wreg(0x0D, 0x00)
-		(stat, recv, bits) = self._tocard(0x0C, ser)
+		return [0x50, 0x00]
+
+	def _halt_send(self, buf):
+
+		# A tag acknowledges HLTA by not answering, so there is no reply to wait
+		# for: once TxIRq shows the frame is out, abort the receive phase and
+		# stop the timer instead of sitting out the whole TReload timeout
+		self._tocard_start(0x0C, buf)
+		i = 200
+		while True:
+			n = self._rreg(0x04)
+			i -= 1
+			if n & 0x40 or i == 0:
+				break
+		self._wreg(0x01, 0x00)
+		self._wreg(0x0C, 0x80)
+		self._cflags(0x0D, 0x80)
+
+		if n & 0x40:
+			self.last_failure = self.FAIL_NONE
+			return self.OK
+		self.last_failure = self.FAIL_OTHER
+		return self.ERR
+
+	def halt(self):
+
+		buf = self._halt_frame()
+		if not self._crc_on:
+			buf += self._crc(buf)
+		return self._halt_send(buf)
+
+	async def halt_async(self):
+
+		buf = self._halt_frame()
+		if not self._crc_on:
+			buf += await self._crc_async(buf)
+		# Transmitting 4 bytes takes well under a millisecond; nothing to yield for
+		return self._halt_send(buf)
+
+	def _check_uid(self, stat, recv):
+
+		ser_chk = 0
 
 		if stat == self.OK:
 			if len(recv) == 5:
@@ -189,15 +472,116 @@ class MFRC522:
 
 		return stat, recv
 
-	def select_tag(self, ser):
+	def _anticoll_frame(self, level):
 
-		buf = [0x93, 0x70] + ser[:5]
-		buf += self._crc(buf)
+		self._set_crc(False)
+		self._wreg(0x0D, 0x00)
+		return [level, 0x20]
+
+	def anticoll(self, level=SEL_CL1):
+
+		(stat, recv, bits) = self._tocard(0x0C, self._anticoll_frame(level))
+		return self._check_uid(stat, recv)
+
+	async def anticoll_async(self, level=SEL_CL1):
+
+		(stat, recv, bits) = await self._tocard_async(0x0C, self._anticoll_frame(level))
+		return self._check_uid(stat, recv)
+
+	def _select_frame(self, ser, level):
+
+		self._set_crc(self.hw_crc)
+		buf = [level, 0x70]
+		buf.extend(ser[:5])
+		return buf
+
+	def _select_result(self, stat, recv, bits):
+
+		# SAK is 1 byte, plus 2 CRC_A bytes unless the chip strips them
+		sak_bits = 0x08 if self._crc_on else 0x18
+		if (stat == self.OK) and (bits == sak_bits):
+			return self.OK, recv[0]
+		return self.ERR, 0
+
+	def select_tag(self, ser, level=SEL_CL1):
+
+		buf = self._select_frame(ser, level)
+		if not self._crc_on:
+			buf += self._crc(buf)
 		(stat, recv, bits) = self._tocard(0x0C, buf)
-		return self.OK if (stat == self.OK) and (bits == 0x18) else self.ERR
+		return self._select_result(stat, recv, bits)[0]
+
+	async def select_tag_async(self, ser, level=SEL_CL1):
+
+		buf = self._select_frame(ser, level)
+		if not self._crc_on:
+			buf += await self._crc_async(buf)
+		(stat, recv, bits) = await self._tocard_async(0x0C, buf)
+		return self._select_result(stat, recv, bits)[0]
+
+	def _cascade_step(self, uid, ser, sak):
+
+		# SAK bit 2 set: UID not complete, ser is CT (0x88) + 3 UID bytes
+		if sak & 0x04:
+			uid.extend(ser[1:4])
+			return False
+		uid.extend(ser[:4])
+		return True
+
+	def select_card(self, cl1=None):
+
+		# Anticollision + SELECT through all cascade levels of a READY tag;
+		# returns (stat, complete 4/7/10-byte UID, final SAK).
+		# cl1: a CL1 anticollision response already received, reused as is
+		uid = bytearray()
+		for level in self.CASCADE_LEVELS:
+			if level == self.SEL_CL1 and cl1 is not None:
+				(stat, ser) = (self.OK, cl1)
+			else:
+				(stat, ser) = self.anticoll(level)
+			if stat != self.OK:
+				return stat, None, 0
+			buf = self._select_frame(ser, level)
+			if not self._crc_on:
+				buf += self._crc(buf)
+			(stat, recv, bits) = self._tocard(0x0C, buf)
+			(stat, sak) = self._select_result(stat, recv, bits)
+			if stat != self.OK:
+				return stat, None, 0
+			if self._cascade_step(uid, ser, sak):
+				return self.OK, bytes(uid), sak
+		return self.ERR, None, 0
+
+	async def select_card_async(self, cl1=None):
+
+		uid = bytearray()
+		for level in self.CASCADE_LEVELS:
+			if level == self.SEL_CL1 and cl1 is not None:
+				(stat, ser) = (self.OK, cl1)
+			else:
+				(stat, ser) = await self.anticoll_async(level)
+			if stat != self.OK:
+				return stat, None, 0
+			buf = self._select_frame(ser, level)
+			if not self._crc_on:
+				buf += await self._crc_async(buf)
+			(stat, recv, bits) = await self._tocard_async(0x0C, buf)
+			(stat, sak) = self._select_result(stat, recv, bits)
+			if stat != self.OK:
+				return stat, None, 0
+			if self._cascade_step(uid, ser, sak):
+				return self.OK, bytes(uid), sak
+		return self.ERR, None, 0
+
+	@classmethod
+	def tag_type(cls, sak):
+
+		return cls.SAK_TAG_TYPES.get(sak & ~0x04, 'unknown')
 
 	def auth(self, mode, addr, sect, ser):
-		return self._tocard(0x0E, [mode, addr] + sect + ser[:4])[0]
+		buf = [mode, addr] + sect
+		buf.extend(ser[:4])
+		return self._tocard(0x0E, buf)[0]
 
 	def stop_crypto1(self):
 		self._cflags(0x08, 0x08)
@@ -205,12 +589,86 @@ class MFRC522:
 	def read(self, addr):
 
 		data = [0x30, addr]
-		data += self._crc(data)
+		if not self._crc_on:
+			data += self._crc(data)
 		(stat, recv, _) = self._tocard(0x0C, data)
-		return recv if stat == self.OK else None
+		return recv[:16] if stat == self.OK else None
+
+	async def read_async(self, addr):
+
+		data = [0x30, addr]
+		if not self._crc_on:
+			data += await self._crc_async(data)
+		(stat, recv, _) = await self._tocard_async(0x0C, data)
+		return recv[:16] if stat == self.OK else None
+
+	def fast_read(self, start_page, end_page):
+
+		data = bytearray()
+		while start_page <= end_page:
+			last = min(end_page, start_page + self.FAST_READ_MAX_PAGES - 1)
+			size = (last - start_page + 1) * 4
+			buf = [0x3A, start_page, last]
+			if not self._crc_on:
+				buf += self._crc(buf)
+			(stat, recv, bits) = self._tocard(0x0C, buf)
+			if stat != self.OK or len(recv) < size:
+				if stat == self.OK:
+					self.last_failure = self.FAIL_NAK if bits == 4 else self.FAIL_OTHER
+				return None
+			data += recv[:size]
+			start_page = last + 1
+		return data
+
+	async def fast_read_async(self, start_page, end_page):
+
+		data = bytearray()
+		while start_page <= end_page:
+			last = min(end_page, start_page + self.FAST_READ_MAX_PAGES - 1)
+			size = (last - start_page + 1) * 4
+			buf = [0x3A, start_page, last]
+			if not self._crc_on:
+				buf += await self._crc_async(buf)
+			(stat, recv, bits) = await self._tocard_async(0x0C, buf)
+			if stat != self.OK or len(recv) < size:
+				if stat == self.OK:
+					self.last_failure = self.FAIL_NAK if bits == 4 else self.FAIL_OTHER
+				return None
+			data += recv[:size]
+			start_page = last + 1
+		return data
+
+	def _write_page_frame(self, page, data):
+
+		# 4-bit ACK/NAK frames carry no CRC_A
+		self._set_crc(False)
+		return [0xA2, page, data[0], data[1], data[2], data[3]]
+
+	def _write_page_result(self, stat, recv, bits):
+
+		if stat != self.OK or bits != 4 or (recv[0] & 0x0F) != 0x0A:
+			return self.ERR
+		return self.OK
+
+	def write_page(self, page, data):
+
+		# NTAG/Ultralight WRITE (0xA2): one 4-byte page
+		buf = self._write_page_frame(page, data)
+		buf += self._crc(buf)
+		(stat, recv, bits) = self._tocard(0x0C, buf)
+		return self._write_page_result(stat, recv, bits)
+
+	async def write_page_async(self, page, data):
+
+		buf = self._write_page_frame(page, data)
+		buf += await self._crc_async(buf)
+		(stat, recv, bits) = await self._tocard_async(0x0C, buf)
+		return self._write_page_result(stat, recv, bits)
 
 	def write(self, addr, data):
 
+		# 4-bit ACK/NAK frames carry no CRC_A
+		self._set_crc(False)
 		buf = [0xA0, addr]
 		buf += self._crc(buf)
 		(stat, recv, bits) = self._tocard(0x0C, buf)
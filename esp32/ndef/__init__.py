@@ -15,3 +15,6 @@ from . import text
 
 message_decoder = message.message_decoder
 message_encoder = message.message_encoder
+message_encode_into = message.message_encode_into
+PreparedMessage = message.PreparedMessage
+record_views = message.record_views
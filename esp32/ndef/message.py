@@ -4,7 +4,7 @@
 """
 
 import io
-from .record import Record, DecodeError
+from .record import Record, RecordView, DecodeError, EncodeError
 
 
 def message_decoder(stream_or_bytes, errors='strict',
@@ -12,8 +12,10 @@ def message_decoder(stream_or_bytes, errors='strict',
 
     if isinstance(stream_or_bytes, (io.BytesIO, io.IOBase)):
         stream = stream_or_bytes
-    elif isinstance(stream_or_bytes, (bytes, bytearray)):
-        stream = io.BytesIO(stream_or_bytes)
+    elif isinstance(stream_or_bytes, (bytes, bytearray, memoryview)):
+        yield from _buffer_decoder(memoryview(stream_or_bytes), errors,
+                                   known_types)
+        return
     else:
         errstr = "a stream or bytes type argument is required, not {}"
         raise TypeError(errstr.format(type(stream_or_bytes).__name__))
@@ -52,6 +54,74 @@ def message_decoder(stream_or_bytes, errors='strict',
                     raise DecodeError('MB flag set in middle record')
 
 
+def _buffer_decoder(buf, errors, known_types):
+    # Same checks as the stream path, walking buf by offset without copies
+    try:
+        record, mb, me, cf, offset = Record._decode_buffer(buf, 0, errors,
+                                                           known_types)
+    except DecodeError:
+        if errors == 'ignore':
+            return  # just stop decoding
+        raise
+
+    if record is not None and mb is False and errors == 'strict':
+        raise DecodeError('MB flag not set in first record')
+
+    if record is not None and known_types is Record._known_types:
+        known_types = type(record)._known_types
+
+    while record is not None:
+        yield record
+        if me is True:
+            if cf is True and errors == 'strict':
+                raise DecodeError('CF flag set in last record')
+            record = None
+        else:
+            try:
+                record, mb, me, cf, offset = Record._decode_buffer(
+                    buf, offset, errors, known_types)
+            except DecodeError:
+                if errors == 'ignore':
+                    return  # just stop decoding
+                raise
+            else:
+                if record is None and errors == 'strict':
+                    raise DecodeError('ME flag not set in last record')
+                if mb is True and errors == 'strict':
+                    raise DecodeError('MB flag set in middle record')
+
+
+def record_views(octets, wanted_types=None):
+    """Iterate over the records of a message buffer without decoding them.
+    Yields a RecordView per record, parsing only the record headers. With
+    wanted_types (record type strings like 'urn:nfc:wkt:T') only the first
+    record of one of these types is yielded and iteration stops there.
+    """
+    if not isinstance(octets, (bytes, bytearray, memoryview)):
+        errstr = "a bytes type argument is required, not {}"
+        raise TypeError(errstr.format(type(octets).__name__))
+
+    buf = memoryview(octets)
+    wanted = None
+    if wanted_types is not None:
+        wanted = set(Record._encode_type(t) for t in wanted_types)
+
+    offset = 0
+    while offset < len(buf):
+        (mb, me, cf, tnf, type_offset, id_offset, payload_offset,
+         end) = Record._decode_header(buf, offset)
+        TYPE = bytes(buf[type_offset:id_offset])
+        if wanted is None or (tnf, TYPE) in wanted:
+            yield RecordView(mb, me, cf, tnf, TYPE,
+                             buf[id_offset:payload_offset],
+                             buf[payload_offset:end])
+            if wanted is not None:
+                return
+        if me:
+            return
+        offset = end
+
+
 def message_encoder(message=None, stream=None):
     encoder = _message_encoder(stream)
     if message is None:
@@ -87,3 +157,46 @@ def _message_encoder(stream):
         this_record = next_record
         next_record = (yield this_result)
         mb_flag = False
+
+
+class PreparedMessage(object):
+    """The records of a message resolved to their encoded fields. The length
+    of the encoded message is known before anything is written, so a caller
+    can frame it (for example in a tag TLV) and check capacity first.
+    """
+    def __init__(self, message):
+        records = []
+        length = 0
+        for record in message:
+            if not isinstance(record, Record):
+                errstr = "an ndef.Record class instance is required, not {}"
+                raise TypeError(errstr.format(type(record).__name__))
+            fields = record._encode_fields()
+            length += Record._encoded_size(*fields[1:])
+            records.append(fields)
+        self.records = records
+        self.length = length
+
+    def encode_into(self, buf, offset=0):
+        """Write the message to buf at offset and return the offset after
+        the last record. Raises EncodeError if it does not fit in buf.
+        """
+        if offset + self.length > len(buf):
+            errstr = "message of {} octets does not fit at offset {} of {}"
+            raise EncodeError(errstr.format(self.length, offset, len(buf)))
+        records = self.records
+        last = len(records) - 1
+        for i, (TNF, TYPE, ID, PAYLOAD) in enumerate(records):
+            # CF is set on a record followed by an 'unchanged' (TNF 6) chunk
+            cf = i < last and records[i + 1][0] == 6
+            offset = Record._encode_into(buf, offset, i == 0, i == last, cf,
+                                         TNF, TYPE, ID, PAYLOAD)
+        return offset
+
+
+def message_encode_into(message, buf, offset=0):
+    """Encode an iterable of records directly into the bytearray buf at
+    offset and return the offset after the last record. Nothing is written
+    if the message does not fit, EncodeError is raised instead.
+    """
+    return PreparedMessage(message).encode_into(buf, offset)
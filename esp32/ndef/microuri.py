@@ -2,8 +2,6 @@
 
 from .record import Record, GlobalRecord
 
-from io import BytesIO
-
 class MicroUri(GlobalRecord):
     _type = 'urn:nfc:wkt:U'
     _prefix_strings = (
@@ -44,9 +42,8 @@ class MicroUri(GlobalRecord):
 
     @classmethod
     def _decode_payload(cls, octets, errors):
-        stream = BytesIO(octets)
-        code = stream.read(1)[0]
-        data = stream.read()
+        code = octets[0]
+        data = bytes(octets[1:])
 
         return cls(cls._prefix_strings[code].encode() + data)
 
@@ -2,6 +2,9 @@ from io import BytesIO
 import struct
 import re
 
+# ustruct raises ValueError, CPython raises struct.error
+struct_error = (getattr(struct, 'error', ValueError), ValueError)
+
 class DecodeError(Exception):
     """NDEF decode error exception class."""
     pass
@@ -10,6 +13,213 @@ class EncodeError(Exception):
     """NDEF encode error exception class."""
     pass
 
+# Compiled struct plans for Record._decode_struct/_encode_struct. The format
+# mini-language ('+' length prefix, '(...)' counted group, '*' repeat/rest)
+# is parsed once per format into a list of ops run with unpack_from/pack_into.
+_FIXED = 0    # (_FIXED, struct format, size, value count)
+_BYTES = 1    # (_BYTES, length format, length size): length-prefixed octets
+_GROUP = 2    # (_GROUP, length format, length size, unit format, unit size)
+_REPEAT = 3   # (_REPEAT, unit format, unit size): repeat unit to the end
+_REST = 4     # (_REST,): all remaining octets
+
+_STRUCT_PLAN_CACHE_SIZE = 16
+_decode_plans = {}
+_encode_plans = {}
+
+# Interned record types. _type_cache maps a type value as given to Record
+# (str or bytes) to ((TNF, TYPE), type string); _type_names holds one dict
+# per TNF mapping TYPE octets to the type string. Types entered by
+# register_type live in the _registered_* tables, which never evict; the
+# bounded caches only hold ad-hoc types seen on first use.
+_TYPE_CACHE_SIZE = 32
+_type_cache = {}
+_type_names = ({}, {}, {}, {}, {}, {}, {})
+_registered_types = {}
+_registered_names = ({}, {}, {}, {}, {}, {}, {})
+_type_prefix = ('', 'urn:nfc:wkt:', '', '', 'urn:nfc:ext:',
+                'unknown', 'unchanged')
+
+
+def _cache_put(cache, key, value):
+    if len(cache) >= _TYPE_CACHE_SIZE:
+        cache.popitem()
+    cache[key] = value
+
+
+def _struct_plan(cache, compile_plan, fmt):
+    plan = cache.get(fmt)
+    if plan is None:
+        plan = compile_plan(fmt)
+        if len(cache) >= _STRUCT_PLAN_CACHE_SIZE:
+            cache.popitem()
+        cache[fmt] = plan
+    return plan
+
+
+def _split_struct_format(fmt):
+    assert fmt[0] not in ('@', '=', '!'), "only '>' and '<' are allowed"
+    assert fmt.count('*') < 2, "only one '*' expression is allowed"
+    assert '*' not in fmt or fmt.find('*') > fmt.rfind('+')
+    return (fmt[0], fmt[1:]) if fmt[0] in ('>', '<') else ('>', fmt)
+
+
+def _fixed_op(order, fmt):
+    # value count as the original parser counted it: characters minus digits
+    vcount = len(fmt) - sum(map(str.isdigit, fmt))
+    return (_FIXED, order + fmt, struct.calcsize(order + fmt), vcount)
+
+
+def _compile_decode_plan(fmt):
+    order, fmt = _split_struct_format(fmt)
+    plan = []
+    this_fmt = fmt
+    while this_fmt:
+        this_fmt, plus_fmt, next_fmt = this_fmt.partition('+')
+        if '*' in this_fmt:
+            this_fmt, star_fmt = this_fmt.split('*', 1)
+            if this_fmt:
+                plan.append(_fixed_op(order, this_fmt))
+            if star_fmt:
+                plan.append((_REPEAT, order + star_fmt,
+                             struct.calcsize(order + star_fmt)))
+            else:
+                plan.append((_REST,))
+            break
+        if this_fmt:
+            plan.append(_fixed_op(order, this_fmt))
+        if plus_fmt:
+            if next_fmt.startswith('('):
+                unit_fmt, next_fmt = next_fmt[1:].split(')', 1)
+                plan.append((_GROUP, None, 0, order + unit_fmt,
+                             struct.calcsize(order + unit_fmt)))
+            else:
+                plan.append((_BYTES, None, 0))
+        this_fmt = next_fmt
+    return plan
+
+
+def _compile_encode_plan(fmt):
+    order, fmt = _split_struct_format(fmt)
+    plan = []
+    this_fmt = fmt
+    while this_fmt:
+        this_fmt, plus_fmt, next_fmt = this_fmt.partition('+')
+        if '*' in this_fmt:
+            this_fmt, star_fmt = this_fmt.split('*', 1)
+            if this_fmt:
+                plan.append(_fixed_op(order, this_fmt))
+            if star_fmt:
+                plan.append((_REPEAT, order + star_fmt,
+                             struct.calcsize(order + star_fmt)))
+            else:
+                plan.append((_REST,))
+            break
+        if plus_fmt:
+            assert this_fmt, "'+' character without preceeding format"
+            # the last format character holds the length of the next value
+            if this_fmt[:-1]:
+                plan.append(_fixed_op(order, this_fmt[:-1]))
+            length_fmt = order + this_fmt[-1]
+            length_size = struct.calcsize(length_fmt)
+            if next_fmt.startswith('('):
+                unit_fmt, next_fmt = next_fmt[1:].split(')', 1)
+                plan.append((_GROUP, length_fmt, length_size, order + unit_fmt,
+                             struct.calcsize(order + unit_fmt)))
+            else:
+                plan.append((_BYTES, length_fmt, length_size))
+        elif this_fmt:
+            plan.append(_fixed_op(order, this_fmt))
+        this_fmt = next_fmt
+    return plan
+
+
+def _run_decode_plan(plan, octets, offset):
+    values = []
+    size = len(octets)
+    for op in plan:
+        kind = op[0]
+        if kind == _FIXED:
+            values.extend(struct.unpack_from(op[1], octets, offset))
+            offset += op[2]
+        elif kind == _BYTES:
+            length = values.pop()
+            if offset + length > size:
+                raise ValueError("buffer too small")
+            values.append(bytes(octets[offset:offset + length]))
+            offset += length
+        elif kind == _GROUP:
+            count = values.pop()
+            group = []
+            for _ in range(count):
+                group.extend(struct.unpack_from(op[3], octets, offset))
+                offset += op[4]
+            values.append(tuple(group))
+        elif kind == _REPEAT:
+            for _ in range((size - offset) // op[2]):
+                values.extend(struct.unpack_from(op[1], octets, offset))
+                offset += op[2]
+            if offset < size:
+                values.append(bytes(octets[offset:]))
+        else:
+            values.append(bytes(octets[offset:]))
+    return values
+
+
+def _run_encode_plan(plan, values):
+    # first pass: output size, second pass: pack_into one buffer
+    size = 0
+    index = 0
+    for op in plan:
+        kind = op[0]
+        if kind == _FIXED:
+            size += op[2]
+            index += op[3]
+        elif kind == _BYTES:
+            size += op[2] + len(values[index])
+            index += 1
+        elif kind == _GROUP:
+            size += op[2] + len(values[index]) * op[4]
+            index += 1
+        elif kind == _REPEAT:
+            size += (len(values) - index) * op[2]
+            index = len(values)
+        else:
+            size += len(values[index])
+            index += 1
+
+    octets = bytearray(size)
+    offset = 0
+    index = 0
+    for op in plan:
+        kind = op[0]
+        if kind == _FIXED:
+            struct.pack_into(op[1], octets, offset, *values[index:index + op[3]])
+            offset += op[2]
+            index += op[3]
+        elif kind == _BYTES or kind == _REST:
+            data = values[index]
+            if kind == _BYTES:
+                struct.pack_into(op[1], octets, offset, len(data))
+                offset += op[2]
+            octets[offset:offset + len(data)] = data
+            offset += len(data)
+            index += 1
+        elif kind == _GROUP:
+            items = values[index]
+            struct.pack_into(op[1], octets, offset, len(items))
+            offset += op[2]
+            for item in items:
+                struct.pack_into(op[3], octets, offset, item)
+                offset += op[4]
+            index += 1
+        else:
+            for item in values[index:]:
+                struct.pack_into(op[1], octets, offset, item)
+                offset += op[2]
+            index = len(values)
+    return bytes(octets)
+
+
 class Record(object):
 
     MAX_PAYLOAD_SIZE = 0x100000
@@ -24,10 +234,11 @@ class Record(object):
         if cls != Record and id(cls._known_types) == id(Record._known_types):
             cls._known_types = {}  # shadow Record.known_types
         cls._known_types[record_class._type] = record_class
+        Record._register_type(record_class._type)
 
 
     def __init__(self, type=None, name=None, data=None):
-        self._type = self._decode_type(*self._encode_type(type))
+        self._type = self._intern_type(type)[1]
         self.name = name
         self._data = data if data else bytearray()
 
@@ -85,19 +296,7 @@ class Record(object):
 
 
     def _encode(self, mb=False, me=False, cf=False, stream=None):
-        TNF, TYPE = self._encode_type(self.type)
-        if TNF == 0:
-            TYPE, ID, PAYLOAD = b'', b'', b''
-        elif TNF == 5:
-            TYPE, ID, PAYLOAD = b'', self.name.encode('latin'), self.data
-        elif TNF == 6:
-            TYPE, ID, PAYLOAD = b'', b'', self.data
-        else:
-            ID, PAYLOAD = self.name.encode('latin'), self.data
-
-        if len(PAYLOAD) > self.MAX_PAYLOAD_SIZE:
-            errstr = "payload of more than {} octets can not be encoded"
-            raise EncodeError(errstr.format(self.MAX_PAYLOAD_SIZE))
+        TNF, TYPE, ID, PAYLOAD = self._encode_fields()
 
         MB = 0b10000000 if mb else 0
         ME = 0b01000000 if me else 0
@@ -113,6 +312,55 @@ class Record(object):
         n = s.write(struct.pack(struct_format, *fields) + TYPE + ID + PAYLOAD)
         return s.getvalue() if stream is None else n
 
+    def _encode_fields(self):
+        # The (TNF, TYPE, ID, PAYLOAD) fields as they go into the record.
+        TNF, TYPE = self._encode_type(self.type)
+        if TNF == 0:
+            TYPE, ID, PAYLOAD = b'', b'', b''
+        elif TNF == 5:
+            TYPE, ID, PAYLOAD = b'', self.name.encode('latin'), self.data
+        elif TNF == 6:
+            TYPE, ID, PAYLOAD = b'', b'', self.data
+        else:
+            ID, PAYLOAD = self.name.encode('latin'), self.data
+
+        if len(PAYLOAD) > self.MAX_PAYLOAD_SIZE:
+            errstr = "payload of more than {} octets can not be encoded"
+            raise EncodeError(errstr.format(self.MAX_PAYLOAD_SIZE))
+
+        return (TNF, TYPE, ID, PAYLOAD)
+
+    @staticmethod
+    def _encoded_size(TYPE, ID, PAYLOAD):
+        header = (3 if len(PAYLOAD) < 256 else 6) + (1 if ID else 0)
+        return header + len(TYPE) + len(ID) + len(PAYLOAD)
+
+    @staticmethod
+    def _encode_into(buf, offset, mb, me, cf, TNF, TYPE, ID, PAYLOAD):
+        # Write one record at buf[offset:] and return the offset after it.
+        # The caller has made sure that _encoded_size() octets fit.
+        SR = len(PAYLOAD) < 256
+        octet0 = ((0b10000000 if mb else 0) | (0b01000000 if me else 0) |
+                  (0b00100000 if cf else 0) | (0b00010000 if SR else 0) |
+                  (0b00001000 if ID else 0) | TNF)
+        buf[offset] = octet0
+        buf[offset + 1] = len(TYPE)
+        offset += 2
+        if SR:
+            buf[offset] = len(PAYLOAD)
+            offset += 1
+        else:
+            struct.pack_into('>L', buf, offset, len(PAYLOAD))
+            offset += 4
+        if ID:
+            buf[offset] = len(ID)
+            offset += 1
+        for field in (TYPE, ID, PAYLOAD):
+            end = offset + len(field)
+            buf[offset:end] = field
+            offset = end
+        return offset
+
 
     @classmethod
     def _decode(cls, stream, errors, known_types):
@@ -159,6 +407,95 @@ class Record(object):
         except AssertionError as error:
             raise DecodeError("buffer underflow at reading {}", error)
 
+        record = cls._decode_record(TNF, TYPE, ID, PAYLOAD, errors, known_types)
+        return (record, MB, ME, CF)
+
+
+    @classmethod
+    def _decode_header(cls, buf, offset):
+        """Parse the record header at offset of a memoryview buffer with
+        plain offset arithmetic. Returns the MB, ME, CF flags, the TNF and
+        the offsets of the TYPE, ID and PAYLOAD fields and of the next
+        record. Nothing is copied or decoded.
+        """
+        size = len(buf)
+        octet0 = buf[offset]
+
+        MB = bool(octet0 & 0b10000000)
+        ME = bool(octet0 & 0b01000000)
+        CF = bool(octet0 & 0b00100000)
+        SR = bool(octet0 & 0b00010000)
+        IL = bool(octet0 & 0b00001000)
+        TNF = octet0 & 0b00000111
+
+        if TNF == 7:
+            raise DecodeError("TNF field value must be between 0 and 6")
+
+        offset += 1
+        if offset + (2 if SR else 5) + (1 if IL else 0) > size:
+            raise DecodeError("buffer underflow at reading length fields")
+
+        TYPE_LENGTH = buf[offset]
+        if SR:
+            PAYLOAD_LENGTH = buf[offset + 1]
+            offset += 2
+        else:
+            PAYLOAD_LENGTH = ((buf[offset + 1] << 24) | (buf[offset + 2] << 16) |
+                              (buf[offset + 3] << 8) | buf[offset + 4])
+            offset += 5
+        ID_LENGTH = 0
+        if IL:
+            ID_LENGTH = buf[offset]
+            offset += 1
+
+        try:
+            if TNF in (0, 5, 6):
+                assert TYPE_LENGTH == 0, "TYPE_LENGTH must be 0"
+            if TNF == 0:
+                assert ID_LENGTH == 0, "ID_LENGTH must be 0"
+                assert PAYLOAD_LENGTH == 0, "PAYLOAD_LENGTH must be 0"
+            if TNF in (1, 2, 3, 4):
+                assert TYPE_LENGTH > 0, "TYPE_LENGTH must be > 0"
+        except AssertionError as error:
+            raise DecodeError(str(error) + " for TNF value {}", TNF)
+
+        if PAYLOAD_LENGTH > cls.MAX_PAYLOAD_SIZE:
+            errstr = "payload of more than {} octets can not be decoded"
+            raise DecodeError(errstr.format(cls.MAX_PAYLOAD_SIZE))
+
+        id_offset = offset + TYPE_LENGTH
+        payload_offset = id_offset + ID_LENGTH
+        end = payload_offset + PAYLOAD_LENGTH
+        if end > size:
+            raise DecodeError("buffer underflow at reading record fields")
+
+        return (MB, ME, CF, TNF, offset, id_offset, payload_offset, end)
+
+
+    @classmethod
+    def _decode_buffer(cls, buf, offset, errors, known_types):
+        """Decode the record starting at offset of a memoryview buffer. The
+        PAYLOAD is passed on as a slice of buf without copying; only the
+        record class that keeps it converts it to bytes. Returns the
+        record (None at the end of buf), the MB, ME, CF flags and the
+        offset of the next record.
+        """
+        if offset >= len(buf):
+            return (None, False, False, False, offset)
+
+        (MB, ME, CF, TNF, type_offset, id_offset, payload_offset,
+         end) = cls._decode_header(buf, offset)
+
+        TYPE = bytes(buf[type_offset:id_offset])
+        ID = bytes(buf[id_offset:payload_offset]) if id_offset < payload_offset else b''
+        PAYLOAD = buf[payload_offset:end]
+
+        record = cls._decode_record(TNF, TYPE, ID, PAYLOAD, errors, known_types)
+        return (record, MB, ME, CF, end)
+
+
+    @classmethod
+    def _decode_record(cls, TNF, TYPE, ID, PAYLOAD, errors, known_types):
         record_type = cls._decode_type(TNF, TYPE)
         if record_type in known_types:
             record_cls = known_types[record_type]
@@ -174,24 +511,63 @@ class Record(object):
             assert isinstance(record, Record)
             record.name = ID
         else:
-            record = Record(record_type, ID, PAYLOAD)
-        return (record, MB, ME, CF)
+            record = Record(record_type, ID, bytes(PAYLOAD))
+        return record
 
 
     @classmethod
     def _decode_type(cls, TNF, TYPE):
-        prefix = ('', 'urn:nfc:wkt:', '', '', 'urn:nfc:ext:',
-                  'unknown', 'unchanged')
         if not 0 <= TNF <= 6:
             raise DecodeError('NDEF Record TNF values must be 0 to 6')
         if TNF in (0, 5, 6):
             TYPE = b''
+        elif not isinstance(TYPE, bytes):
+            TYPE = bytes(TYPE)  # bytearray/memoryview are not hashable keys
 
-        return prefix[TNF] + (TYPE.decode('ascii'))
+        name = _registered_names[TNF].get(TYPE)
+        if name is None:
+            names = _type_names[TNF]
+            name = names.get(TYPE)
+            if name is None:
+                name = _type_prefix[TNF] + (TYPE.decode('ascii'))
+                _cache_put(names, TYPE, name)
+        return name
 
 
     @classmethod
     def _encode_type(cls, value):
+        return cls._intern_type(value)[0]
+
+    @classmethod
+    def _intern_type(cls, value):
+        # Return ((TNF, TYPE), type string) for a record type value. Only
+        # the first use of a value goes through _resolve_type.
+        key = bytes(value) if isinstance(value, bytearray) else value
+        if key is None or isinstance(key, (str, bytes)):
+            entry = _registered_types.get(key)
+            if entry is None:
+                entry = _type_cache.get(key)
+            if entry is None:
+                TNF, TYPE = cls._resolve_type(key)
+                entry = ((TNF, TYPE), cls._decode_type(TNF, TYPE))
+                _cache_put(_type_cache, key, entry)
+            return entry
+        TNF, TYPE = cls._resolve_type(value)
+        return ((TNF, TYPE), cls._decode_type(TNF, TYPE))
+
+    @classmethod
+    def _register_type(cls, value):
+        # Intern a registered type in the tables that never evict, so the
+        # common types keep their fast path however many others are seen.
+        key = bytes(value) if isinstance(value, bytearray) else value
+        TNF, TYPE = cls._resolve_type(key)
+        name = _type_prefix[TNF] + (TYPE.decode('ascii'))
+        _registered_names[TNF][TYPE] = name
+        _registered_types[key] = ((TNF, TYPE), name)
+        _registered_types[name] = ((TNF, TYPE), name)
+
+    @classmethod
+    def _resolve_type(cls, value):
         if value is None:
             _value = b''
         elif isinstance(value, bytearray):
@@ -228,97 +604,40 @@ class Record(object):
         return (TNF, TYPE)
 
 
+    @classmethod
+    def _decode_error(cls, fmt, *args):
+        return DecodeError(cls.__name__ + ' ' + fmt.format(*args))
+
+    @classmethod
+    def _encode_error(cls, fmt, *args):
+        return EncodeError(cls.__name__ + ' ' + fmt.format(*args))
+
+
     @classmethod
     def _decode_struct(cls, fmt, octets, offset=0, always_tuple=False):
-        assert fmt[0] not in ('@', '=', '!'), "only '>' and '<' are allowed"
-        assert fmt.count('*') < 2, "only one '*' expression is allowed"
-        assert '*' not in fmt or fmt.find('*') > fmt.rfind('+')
-        order, fmt = (fmt[0], fmt[1:]) if fmt[0] in ('>', '<') else ('>', fmt)
+        plan = _struct_plan(_decode_plans, _compile_decode_plan, fmt)
         try:
-            values = list()
-            this_fmt = fmt
-            while this_fmt:
-                this_fmt, plus_fmt, next_fmt = this_fmt.partition('+')
-                if '*' in this_fmt:
-                    this_fmt, next_fmt = this_fmt.split('*', 1)
-                    if this_fmt:
-                        next_fmt = '*' + next_fmt
-                    elif next_fmt:
-                        trailing = len(octets) - offset
-                        size_fmt = struct.calcsize(next_fmt)
-                        this_fmt = int(trailing / size_fmt) * next_fmt
-                        next_fmt = '*' if trailing % size_fmt else ''
-                    else:
-                        this_fmt = str(len(octets) - offset) + 's'
-                        next_fmt = ''
-                struct_format = order + this_fmt
-                values = values + list(struct.unpack_from(struct_format, octets, offset))
-                offset = offset + struct.calcsize(struct_format)
-                if plus_fmt:
-                    if next_fmt.startswith('('):
-                        this_fmt, next_fmt = next_fmt[1:].split(')', 1)
-                        struct_format = order + values.pop() * this_fmt
-                        values.append(struct.unpack_from(struct_format, octets, offset))
-                        offset = offset + struct.calcsize(struct_format)
-                    else:
-                        struct_format = '{:d}s'.format(values.pop())
-                        values.extend(struct.unpack_from(struct_format, octets, offset))
-                        offset = offset + struct.calcsize(struct_format)
-                this_fmt = next_fmt
+            if len(plan) == 1 and plan[0][0] == _FIXED:
+                values = struct.unpack_from(plan[0][1], octets, offset)
+            else:
+                values = _run_decode_plan(plan, octets, offset)
         except struct_error as error:
             raise cls._decode_error(str(error))
+        if len(values) == 1 and not always_tuple:
+            return values[0]
         else:
-            if len(values) == 1 and not always_tuple:
-                return values[0]
-            else:
-                return tuple(values)
+            return tuple(values)
 
 
     @classmethod
     def _encode_struct(cls, fmt, *values):
-        assert fmt[0] not in ('@', '=', '!'), "only '>' and '<' are allowed"
-        assert fmt.count('*') < 2, "only one '*' expression is allowed"
-        assert '*' not in fmt or fmt.find('*') > fmt.rfind('+')
-        order, fmt = (fmt[0], fmt[1:]) if fmt[0] in ('>', '<') else ('>', fmt)
+        plan = _struct_plan(_encode_plans, _compile_encode_plan, fmt)
         try:
-            values = list(values)
-            octets = list()
-            this_fmt = fmt
-            while this_fmt:
-                this_fmt, plus_fmt, next_fmt = this_fmt.partition('+')
-                if '*' in this_fmt:
-                    this_fmt, next_fmt = this_fmt.split('*', 1)
-                    if this_fmt:
-                        next_fmt = '*' + next_fmt
-                    elif next_fmt:
-                        this_fmt = len(values) * next_fmt
-                        next_fmt = ''
-                    else:
-                        this_fmt = str(len(values[0])) + 's'
-                        next_fmt = ''
-                vcount = len(this_fmt) - sum(map(str.isdigit, this_fmt))
-                if plus_fmt:
-                    assert this_fmt, "'+' character without preceeding format"
-                    if next_fmt.startswith('('):
-                        length = len(values[vcount-1])
-                        values.insert(vcount-1, length)
-                        this_fmt += length * next_fmt[1:].split(')', 1)[0]
-                        next_fmt = next_fmt[1:].split(')', 1)[1]
-                        values[vcount:vcount+1] = list(values[vcount])
-                        vcount = vcount + length
-                    else:
-                        vcount = vcount + 1
-                        length = len(values[vcount-2])
-                        values.insert(vcount-2, length)
-                        this_fmt = this_fmt + str(length) + 's'
-                struct_format = order + this_fmt
-                octets.append(struct.pack(struct_format, *values[0:vcount]))
-                del values[0:vcount]
-                this_fmt = next_fmt
+            if len(plan) == 1 and plan[0][0] == _FIXED:
+                return struct.pack(plan[0][1], *values)
+            return _run_encode_plan(plan, values)
         except struct_error as error:
             raise cls._encode_error(str(error))
-        else:
-            return b''.join(octets)
 
     @classmethod
     def _value_to_ascii(cls, value, name):
@@ -350,6 +669,31 @@ class Record(object):
             raise ValueError(errstr, value)
 
 
+class RecordView(object):
+    """An undecoded record inside a message buffer. TNF and TYPE are the
+    raw NDEF field values, ID and PAYLOAD are memoryview slices of the
+    buffer. Call decode() to get the full Record instance.
+    """
+
+    def __init__(self, MB, ME, CF, TNF, TYPE, ID, PAYLOAD):
+        self.MB = MB
+        self.ME = ME
+        self.CF = CF
+        self.TNF = TNF
+        self.TYPE = TYPE
+        self.ID = ID
+        self.PAYLOAD = PAYLOAD
+
+    @property
+    def type(self):
+        """The record type string, as Record.type would report it."""
+        return Record._decode_type(self.TNF, self.TYPE)
+
+    def decode(self, errors='strict', known_types=Record._known_types):
+        return Record._decode_record(self.TNF, self.TYPE, bytes(self.ID),
+                                     self.PAYLOAD, errors, known_types)
+
+
 class GlobalRecord(Record):  # pragma: no cover
     def __init__(self, *args, **kwargs):
         assert hasattr(self, '_type'),\
@@ -77,9 +77,9 @@ class TextRecord(GlobalRecord):
         if FLAG & 0x3F >= len(octets):
             raise cls._decode_error("language code length exceeds payload")
         UTFX = "UTF-16" if FLAG >> 7 else "UTF-8"
-        LANG = octets[1:1+(FLAG & 0x3F)]
+        LANG = bytes(octets[1:1+(FLAG & 0x3F)])
         try:
-            TEXT = octets[1+len(LANG):].decode(UTFX)
+            TEXT = bytes(octets[1+len(LANG):]).decode(UTFX)
         except UnicodeDecodeError:
             raise cls._decode_error("can't be decoded as {}".format(UTFX))
         return cls(TEXT, LANG, UTFX)
@@ -12,6 +12,7 @@ except ImportError:
 # --- 模块全局变量 ---
 _mqtt_client = None
 _config = None # 存储加载的配置
+_subscriptions = {} # 已订阅的 topic (bytes) -> 回调函数 callback(topic, msg)
 
 def connect_wifi(ssid, password, display_module):
     """
@@ -88,6 +89,7 @@ def connect_mqtt(display_module):
         display_module.oled_show_message("连接 MQTT...", broker)
         _mqtt_client.connect() # 阻塞调用
         print("MQTT 连接成功!")
+        _resubscribe()
         display_module.oled_show_message("MQTT 已连接")
         time.sleep(1) # 短暂显示
         return True
@@ -97,7 +99,48 @@ def connect_mqtt(display_module):
         time.sleep(2)
         return False
 
-def try_publish_mqtt(topic, value):
+def _on_mqtt_message(topic, msg):
+    """umqtt 回调: 按 topic 分发给 subscribe_mqtt() 注册的回调。"""
+    callback = _subscriptions.get(topic)
+    if callback is None:
+        return
+    try:
+        callback(topic, msg)
+    except Exception as e:
+        print(f"!!!!! 错误: 处理 MQTT 消息失败 ({topic}): {e}")
+
+def _resubscribe():
+    """(重新)连接后订阅所有已注册的 topic。"""
+    if _mqtt_client is None or not _subscriptions:
+        return
+    try:
+        _mqtt_client.set_callback(_on_mqtt_message)
+        for topic in _subscriptions:
+            _mqtt_client.subscribe(topic)
+            if config.DEBUG: print(f"MQTT Subscribed: {topic}")
+    except Exception as e:
+        print(f"!!!!! 错误: MQTT subscribe 失败: {e}")
+
+def subscribe_mqtt(topic, callback):
+    """
+    注册 topic 的消息回调并立即订阅；之后每次重连都会自动重新订阅。
+    需要定期调用 check_mqtt_msg() 才会收到消息。
+    """
+    if not topic:
+        return
+    _subscriptions[topic.encode()] = callback
+    _resubscribe()
+
+def check_mqtt_msg():
+    """非阻塞地处理一条待收的 MQTT 消息 (如果有)。"""
+    if _mqtt_client is None or not _subscriptions:
+        return
+    try:
+        _mqtt_client.check_msg()
+    except Exception as e:
+        if config.DEBUG: print(f"DEBUG: MQTT check_msg 失败: {e}")
+
+def try_publish_mqtt(topic, value, retain=True):
     """
     尝试发布 MQTT 消息，如果失败则标记重连。
     """
@@ -108,7 +151,7 @@ def try_publish_mqtt(topic, value):
         return
 
     try:
-        _mqtt_client.publish(topic, str(value), retain=True)
+        _mqtt_client.publish(topic, str(value), retain=retain)
         if config.DEBUG: print(f"MQTT Published: {topic} = {value}")
     except Exception as e:
         print(f"!!!!! 错误: MQTT publish 失败: {e}. 标记重连。")
@@ -122,7 +165,7 @@ def try_publish_mqtt(topic, value):
         try:
             connect_mqtt(display) 
             print("MQTT: 重连成功。")
-            _mqtt_client.publish(topic, str(value), retain=True)
+            _mqtt_client.publish(topic, str(value), retain=retain)
             if config.DEBUG: print(f"MQTT (重试) Published: {topic} = {value}")
         except Exception as e2:
             print(f"!!!!! 错误: MQTT 重连失败: {e2}。等待下一次 publish。")
@@ -0,0 +1,167 @@
+import gc
+import io
+import time
+
+import ndef
+
+try:
+    ticks_us = time.ticks_us
+    ticks_diff = time.ticks_diff
+except AttributeError:  # CPython
+    def ticks_us():
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(a, b):
+        return a - b
+
+
+def _reset_field(rdr):
+    """关闭再打开天线，让标签回到 IDLE 状态，保证每轮从 REQA 开始。"""
+    rdr.antenna_on(False)
+    time.sleep_ms(5)
+    rdr.antenna_on()
+    time.sleep_ms(5)
+
+
+def _read_once(rdr):
+    """完整读取一次标签: REQA -> 防冲突/SELECT (全部级联级别) -> FAST_READ Page 4..47。"""
+    (stat, _) = rdr.request(rdr.REQIDL)
+    if stat != rdr.OK:
+        return False
+    (stat, uid, sak) = rdr.select_card()
+    if stat != rdr.OK:
+        return False
+    return rdr.fast_read(0x04, 0x2F) is not None
+
+
+def bench_crc_modes(rdr, rounds=10):
+    """
+    对比软件 CRC (CalcCRC) 与硬件 CRC 模式下，每次读取标签的 SPI 事务数和耗时。
+    需要在读卡器上放置一个标签。返回 {模式: (成功次数, SPI事务/次, 微秒/次)}。
+    """
+    results = {}
+    saved_mode = rdr.hw_crc
+    try:
+        for hw_crc in (False, True):
+            rdr.hw_crc = hw_crc
+            ok = ops = elapsed_us = 0
+            for _ in range(rounds):
+                _reset_field(rdr)
+                start_ops = rdr.spi_ops
+                start_us = ticks_us()
+                if _read_once(rdr):
+                    ok += 1
+                    elapsed_us += ticks_diff(ticks_us(), start_us)
+                    ops += rdr.spi_ops - start_ops
+            mode = "hw_crc" if hw_crc else "sw_crc"
+            results[mode] = (ok, ops // ok if ok else 0, elapsed_us // ok if ok else 0)
+            print(f"{mode}: 成功 {ok}/{rounds}, SPI 事务 {results[mode][1]}/次, {results[mode][2]} us/次")
+    finally:
+        rdr.hw_crc = saved_mode
+    return results
+
+
+def bench_read_alloc(rdr, rounds=10):
+    """
+    测量每次完整读取标签的堆分配量 (gc.mem_alloc() 差值) 和耗时。
+    测量期间禁用 GC，避免回收抵消分配量。返回 (成功次数, 字节/次, 微秒/次)。
+    """
+    ok = alloc = elapsed_us = 0
+    for _ in range(rounds):
+        _reset_field(rdr)
+        gc.collect()
+        gc.disable()
+        start_alloc = gc.mem_alloc()
+        start_us = ticks_us()
+        success = _read_once(rdr)
+        elapsed = ticks_diff(ticks_us(), start_us)
+        used = gc.mem_alloc() - start_alloc
+        gc.enable()
+        if success:
+            ok += 1
+            alloc += used
+            elapsed_us += elapsed
+    result = (ok, alloc // ok if ok else 0, elapsed_us // ok if ok else 0)
+    print(f"read: 成功 {ok}/{rounds}, 堆分配 {result[1]} 字节/次, {result[2]} us/次")
+    return result
+
+
+def _measure_alloc(fn, rounds):
+    """
+    每次调用 fn 的堆分配字节数。MicroPython: 禁用 GC 后的 gc.mem_alloc() 差值；
+    CPython: tracemalloc 统计的峰值 (引用计数会立即释放对象，无法统计累计分配)。
+    """
+    fn()  # 预热，排除首次调用的缓存分配
+    gc.collect()
+    if hasattr(gc, "mem_alloc"):
+        gc.disable()
+        start_alloc = gc.mem_alloc()
+        for _ in range(rounds):
+            fn()
+        used = gc.mem_alloc() - start_alloc
+        gc.enable()
+        return used // rounds
+    import tracemalloc
+    tracemalloc.start()
+    start_alloc = tracemalloc.get_traced_memory()[0]
+    for _ in range(rounds):
+        fn()
+    peak = tracemalloc.get_traced_memory()[1] - start_alloc
+    tracemalloc.stop()
+    return peak
+
+
+def _measure_time(fn, rounds):
+    """每次调用 fn 的平均耗时 (微秒)。"""
+    gc.collect()
+    start_us = ticks_us()
+    for _ in range(rounds):
+        fn()
+    return ticks_diff(ticks_us(), start_us) // rounds
+
+
+def _sample_message():
+    """典型的多记录耗材标签: URI 记录后跟文本 (耗材 ID) 记录。"""
+    records = [ndef.microuri.MicroUri("https://example.com/spool"), ndef.text.TextRecord("PLA-RED-0000000000001")]
+    return bytearray(b"".join(ndef.message_encoder(records)))
+
+
+def bench_ndef_decode(rounds=1000):
+    """
+    对比 NDEF 解码路径: BytesIO 流 (旧路径) 与 memoryview 偏移遍历 (bytes/bytearray 输入)。
+    可在主机上运行 (CPython 与 MicroPython unix 版)。返回 {路径: (字节/次, 微秒/次)}。
+    """
+    message = _sample_message()
+
+    def decode_stream():
+        for record in ndef.message_decoder(io.BytesIO(message)):
+            pass
+
+    def decode_buffer():
+        for record in ndef.message_decoder(message):
+            pass
+
+    results = {}
+    for name, fn in (("stream", decode_stream), ("memoryview", decode_buffer)):
+        results[name] = (_measure_alloc(fn, rounds), _measure_time(fn, rounds))
+        print(f"ndef {name}: {results[name][0]} 字节/次, {results[name][1]} us/次")
+    return results
+
+
+def run(slot=1, rounds=10):
+    """在 REPL 中运行: import nfc_bench; nfc_bench.run(slot=1)"""
+    import nfc_reader
+    readers = nfc_reader.init_readers()
+    if not readers:
+        print("!!!!! 错误: 没有可用的读卡器。")
+        return None
+    rdr = readers[slot - 1]
+    return {
+        "crc_modes": bench_crc_modes(rdr, rounds),
+        "read_alloc": bench_read_alloc(rdr, rounds),
+    }
+
+
+if __name__ == "__main__":
+    # 主机上只运行与硬件无关的基准: python3 nfc_bench.py / micropython nfc_bench.py
+    bench_ndef_decode()
@@ -1,42 +1,128 @@
 import time
 import ubinascii
 import micropython
+import uasyncio
 import config
 
 # --- 导入依赖库 ---
 try:
     import ndef
     from mfrc522 import MFRC522
+    from spi_bus import SPIBus
     mfrc522 = True
 except ImportError as e:
     print(f"!!!!! 致命错误: 缺少 MFRC522 或 NDEF 库: {e} !!!!!")
     mfrc522 = None
     ndef = None
 
-def init_readers():
+# --- 模块全局变量 ---
+# 每个槽位的标签缓存: id(读卡器) -> (UID, CL1 防冲突应答, 解码文本, 上次完整读取的 ticks_ms)
+_tag_cache = {}
+# 每个槽位的读取失败统计: id(读卡器) -> {失败类别: 次数}
+_failure_stats = {}
+
+# 首次读取 CC (Page 3) 之后附带读取的数据页数，通常足以覆盖 NDEF TLV 头
+NDEF_HEAD_PAGES = 3
+# 耗材 ID 所在的记录类型
+NDEF_TEXT_TYPES = ('urn:nfc:wkt:T',)
+# NTAG21x 用户数据区大小 (字节，自 Page 4 起)，与 CC 字节 2 * 8 一致
+NTAG213_DATA_AREA = 144
+NTAG215_DATA_AREA = 496
+NTAG216_DATA_AREA = 872
+
+# write_ultralight_ndef() 的结果
+WRITE_OK = 'ok'
+WRITE_READ_FAILED = 'read_failed'      # 读取 CC 或当前镜像失败
+WRITE_NOT_NDEF = 'not_ndef'            # CC 魔数无效，标签未格式化为 NDEF
+WRITE_READ_ONLY = 'read_only'          # CC 写权限字节不为 0x00
+WRITE_TOO_LARGE = 'too_large'          # 镜像超出标签数据区
+WRITE_FAILED = 'write_failed'          # 某页 WRITE 未收到 ACK
+WRITE_VERIFY_FAILED = 'verify_failed'  # 回读内容与镜像不符
+
+def calibrate_spi_clock(rdr):
+    """
+    逐级提高读卡器的 SPI 时钟，每一级用 VersionReg 和 ModWidthReg 写入/回读校验链路。
+    取无误码的最高一级，再降 READER_SPI_CLOCK_MARGIN 级作为安全余量，返回选定的时钟。
+    """
+    steps = config.READER_SPI_CLOCK_STEPS
+    rdr.set_baudrate(config.READER_SPI_SAFE_BAUDRATE)
+    version = rdr.version()
+    if version in (0x00, 0xFF):
+        print(f"!!!!! 警告: 读卡器无响应 (VersionReg=0x{version:02X})，保持 {config.READER_SPI_SAFE_BAUDRATE}Hz !!!!!")
+        return config.READER_SPI_SAFE_BAUDRATE
+
+    best = -1
+    for i, baudrate in enumerate(steps):
+        rdr.set_baudrate(baudrate)
+        errors = rdr.link_errors(config.READER_SPI_CALIBRATION_ROUNDS, version)
+        if config.DEBUG: print(f"DEBUG:   SPI {baudrate}Hz: {errors} 个错误")
+        if errors:
+            break
+        best = i
+
+    baudrate = steps[best - config.READER_SPI_CLOCK_MARGIN] if best >= config.READER_SPI_CLOCK_MARGIN else config.READER_SPI_SAFE_BAUDRATE
+    rdr.set_baudrate(baudrate)
+    rdr.init()
+    return baudrate
+
+
+def init_readers(config_data=None, recalibrate=False):
     """
     根据 config.py 中的定义初始化所有 MFRC522 读卡器。
+    每个读卡器使用 config.json 中保存的 SPI 时钟；没有保存值、链路校验失败
+    或 recalibrate=True 时重新校准，并将结果写回 config.json。
+    reader_rf_settings 中保存的射频参数 (calibrate_rf 的结果) 在 init 时写入芯片。
     """
     if mfrc522 is None:
         return []
         
     readers = []
     spi_pins = config.READER_SPI_SHARED
+    stored = config_data.get("reader_spi_baudrates") if config_data else None
+    rf_settings = (config_data.get("reader_rf_settings") if config_data else None) or []
+    baudrates = []
     
     try:
+        # 所有读卡器共享同一个 SPI 总线对象
+        bus = SPIBus(
+            spi_pins['sck'],
+            spi_pins['mosi'],
+            spi_pins['miso'],
+            spi_id=config.READER_SPI_ID,
+            baudrate=config.READER_SPI_SAFE_BAUDRATE
+        )
         for i, reader_pins in enumerate(config.READER_PINS):
             if config.DEBUG:
                 print(f"DEBUG: 初始化读卡器 {i+1} (CS={reader_pins['cs']}, RST={reader_pins['rst']})...")
+
+            baudrate = None
+            if stored and i < len(stored) and not recalibrate:
+                baudrate = stored[i]
+            rf = rf_settings[i] if i < len(rf_settings) and rf_settings[i] else (None, None)
             
-            readers.append(
-                MFRC522(
-                    sck=spi_pins['sck'],
-                    mosi=spi_pins['mosi'],
-                    miso=spi_pins['miso'],
-                    rst=reader_pins['rst'],
-                    cs=reader_pins['cs']
-                )
+            rdr = MFRC522(
+                sck=spi_pins['sck'],
+                mosi=spi_pins['mosi'],
+                miso=spi_pins['miso'],
+                rst=reader_pins['rst'],
+                cs=reader_pins['cs'],
+                hw_crc=config.READER_HW_CRC,
+                irq=reader_pins.get('irq'),
+                bus=bus,
+                baudrate=baudrate or config.READER_SPI_SAFE_BAUDRATE,
+                rx_gain=rf[0],
+                mod_width=rf[1]
             )
+            if baudrate is None or not rdr.link_ok():
+                if config.DEBUG: print(f"DEBUG: 正在校准读卡器 {i+1} 的 SPI 时钟...")
+                calibrate_spi_clock(rdr)
+            if config.DEBUG: print(f"DEBUG: 读卡器 {i+1} SPI 时钟: {rdr.baudrate}Hz")
+            baudrates.append(rdr.baudrate)
+            readers.append(rdr)
+
+        if config_data is not None and baudrates != stored:
+            config_data["reader_spi_baudrates"] = baudrates
+            config.save_config(config_data)
         if config.DEBUG:
             print(f"DEBUG: {len(readers)}个 MFRC522 读卡器已初始化。")
         return readers
@@ -45,118 +131,435 @@ def init_readers():
         return []
 
 
-@micropython.native  # (V39) 优化: 编译为本地字节码
-def parse_ndef_message(raw_data):
+async def _probe_read(rdr):
+    """唤醒、选中标签并读取一次 CC 和数据区开头 (不重试)，返回是否成功。"""
+    ok = False
+    (stat, _) = await rdr.wakeup_async()
+    if stat == rdr.OK:
+        (stat, _, _) = await rdr.select_card_async()
+        if stat == rdr.OK:
+            data = await rdr.fast_read_async(0x03, 0x03 + NDEF_HEAD_PAGES)
+            ok = data is not None and data[0] == 0xE1
+        await rdr.halt_async()
+    return ok
+
+
+async def calibrate_rf(rdr, rounds=None):
     """
-    从原始页数据中解析 NDEF 消息。
+    (Async) 射频参数校准，需要在读卡器上放一张参考标签。
+    遍历 READER_RF_RX_GAINS x READER_RF_MOD_WIDTHS 的每一组 RxGain (RFCfgReg) / ModWidth，
+    每组做 rounds 次不重试的完整读取，记录首次成功率和平均耗时。
+    先测当前设置，选成功次数最多的一组并应用到读卡器，返回 ((rx_gain, mod_width), 该组结果)；
+    成功次数相同时保留先测的一组 (当前设置优先)，除非平均耗时快出 READER_RF_LATENCY_MARGIN_MS；
+    参考标签在所有设置下都读不到时恢复原设置并返回 (None, None)。
+    整个校准过程持有读卡器的 exchange 锁。
     """
-    if ndef is None: return None
-    
-    if config.DEBUG: print("  [.] 正在解析 NDEF 数据...")
-    try:
-        offset = 0
-        while offset < len(raw_data):
-            tlv_type = raw_data[offset]
-            offset += 1
-            if offset >= len(raw_data):
-                if config.DEBUG: print(f"  [!] TLV 解析错误: 在读取 T:0x{tlv_type:X} 后数据意外结束。")
-                break
-            tlv_length = raw_data[offset]
-            offset += 1
-            if tlv_length == 0xFF:
-                if (offset + 2) > len(raw_data):
-                    if config.DEBUG: print(f"  [!] TLV 解析错误: 3字节长度字段数据不足。")
-                    break
-                tlv_length = (raw_data[offset] << 8) | raw_data[offset + 1]
-                offset += 2
-            if tlv_type == 0x03:
-                if config.DEBUG: print(f"  [+] 找到 NDEF Message TLV (Type 0x03)，长度: {tlv_length} 字节")
-                msg_start_index = offset
-                msg_end_index = msg_start_index + tlv_length
-                if msg_end_index > len(raw_data):
-                    if config.DEBUG: print(f"  [!] TLV 解析错误: NDEF 消息长度 ({tlv_length}) 超出数据范围。")
+    async with rdr.exchange:
+        return await _calibrate_rf(rdr, rounds or config.READER_RF_CALIBRATION_ROUNDS)
+
+
+async def _calibrate_rf(rdr, rounds):
+    previous = (rdr.rx_gain, rdr.mod_width)
+    candidates = [previous]
+    for mod_width in config.READER_RF_MOD_WIDTHS:
+        for rx_gain in config.READER_RF_RX_GAINS:
+            if (rx_gain, mod_width) != previous:
+                candidates.append((rx_gain, mod_width))
+
+    margin_ms = config.READER_RF_LATENCY_MARGIN_MS
+    best = None
+    best_result = None
+    for (rx_gain, mod_width) in candidates:
+        rdr.set_rf(rx_gain, mod_width)
+        ok = 0
+        total_ms = 0
+        for _ in range(rounds):
+            start_ms = time.ticks_ms()
+            if await _probe_read(rdr):
+                ok += 1
+                total_ms += time.ticks_diff(time.ticks_ms(), start_ms)
+        avg_ms = total_ms // ok if ok else None
+        if config.DEBUG: print(f"DEBUG:   RxGain {rx_gain} ModWidth 0x{mod_width:02X}: {ok}/{rounds} 成功, 平均 {avg_ms}ms")
+        if ok and (best_result is None or ok > best_result["ok"]
+                   or (ok == best_result["ok"] and avg_ms + margin_ms <= best_result["avg_ms"])):
+            best = (rx_gain, mod_width)
+            best_result = {"ok": ok, "rounds": rounds, "avg_ms": avg_ms}
+
+    rdr.set_rf(*(best or previous))
+    return best, best_result
+
+
+def save_rf_settings(config_data, index, settings):
+    """把第 index 个读卡器的射频参数 (rx_gain, mod_width) 写入 config.json。"""
+    stored = list(config_data.get("reader_rf_settings") or [])
+    while len(stored) <= index:
+        stored.append(None)
+    stored[index] = list(settings)
+    config_data["reader_rf_settings"] = stored
+    config.save_config(config_data)
+
+
+class TLVStreamParser:
+    """
+    Type 2 标签数据区的增量 TLV 解析器。按页块调用 feed()，每次返回当前状态:
+    NEED_MORE (还需要至少 needed 字节)、COMPLETE (NDEF 消息已完整，或遇到
+    Terminator TLV 而没有 NDEF 消息，此时 message 为 None) 或 INVALID。
+    只缓存 NDEF 消息本身，Lock/Memory Control 等 TLV 的值直接跳过。
+    """
+
+    NEED_MORE = 0
+    COMPLETE = 1
+    INVALID = 2
+
+    _TYPE = 0
+    _LENGTH = 1
+    _LENGTH16 = 2
+    _VALUE = 3
+
+    def __init__(self, max_size=0xFFFE):
+        self.max_size = max_size
+        self.status = self.NEED_MORE
+        self.needed = 1
+        self.message = None
+        self._state = self._TYPE
+        self._type = 0
+        self._length = 0
+        self._remaining = 0
+        self._filled = 0
+
+    def _begin_value(self, length):
+        if self._type in (0x01, 0x02) and length != 3:
+            if config.DEBUG: print(f"  [!] TLV 解析错误: Control TLV 0x{self._type:X} 长度 {length} 无效。")
+            self.status = self.INVALID
+            return
+        if self._type == 0x03:
+            if length > self.max_size:
+                if config.DEBUG: print(f"  [!] TLV 解析错误: NDEF 消息长度 ({length}) 超出数据区。")
+                self.status = self.INVALID
+                return
+            if config.DEBUG: print(f"  [+] 找到 NDEF Message TLV (Type 0x03)，长度: {length} 字节")
+            self.message = bytearray(length)
+            self._filled = 0
+            if length == 0:
+                self.status = self.COMPLETE
+                return
+        elif config.DEBUG:
+            print(f"  [.] 跳过 TLV (Type 0x{self._type:X}), 长度: {length}")
+        self._remaining = length
+        self._state = self._VALUE if length else self._TYPE
+
+    def feed(self, chunk):
+        i = 0
+        n = len(chunk)
+        while i < n and self.status == self.NEED_MORE:
+            state = self._state
+            if state == self._TYPE:
+                tlv_type = chunk[i]
+                i += 1
+                if tlv_type == 0x00:
+                    continue
+                if tlv_type == 0xFE:
+                    if config.DEBUG: print("  [.] 遇到 Terminator TLV (0xFE)，停止解析。")
+                    self.status = self.COMPLETE
                     break
-                ndef_message_bytes = raw_data[msg_start_index:msg_end_index]
-                
-                for record in ndef.message_decoder(ndef_message_bytes, errors="strict"):
-                    if config.DEBUG: print(f"    - 记录类型: {record.type}")
-                    if isinstance(record, ndef.text.TextRecord):
-                        if config.DEBUG: print(f"    >>> 找到文本: {record.text}")
-                        return record.text
-                    elif isinstance(record, ndef.microuri.MicroUri):
-                        if config.DEBUG: print(f"    >>> 找到 URI: {record.uri}")
-                return None
-            elif tlv_type == 0x00:
-                if config.DEBUG: print("  [.] 跳过 Null TLV (0x00)")
-                continue
-            elif tlv_type == 0xFE:
-                if config.DEBUG: print("  [.] 遇到 Terminator TLV (0xFE)，停止解析。")
-                break
+                self._type = tlv_type
+                self._state = self._LENGTH
+            elif state == self._LENGTH:
+                length = chunk[i]
+                i += 1
+                if length == 0xFF:
+                    self._length = 0
+                    self._remaining = 2
+                    self._state = self._LENGTH16
+                else:
+                    self._begin_value(length)
+            elif state == self._LENGTH16:
+                self._length = (self._length << 8) | chunk[i]
+                i += 1
+                self._remaining -= 1
+                if self._remaining == 0:
+                    self._begin_value(self._length)
             else:
-                if config.DEBUG: print(f"  [.] 跳过未知 TLV (Type 0x{tlv_type:X}), 长度: {tlv_length}")
-                offset += tlv_length
-                if offset > len(raw_data):
-                    if config.DEBUG: print(f"  [!] TLV 解析错误: TLV 0x{tlv_type:X} 的值超出了数据范围。")
-                    break
-        if config.DEBUG: print("  [!] 遍历了所有 TLV，未找到 NDEF 消息 (Type 0x03)。")
+                take = min(n - i, self._remaining)
+                if self._type == 0x03:
+                    self.message[self._filled:self._filled + take] = chunk[i:i + take]
+                    self._filled += take
+                i += take
+                self._remaining -= take
+                if self._remaining == 0:
+                    if self._type == 0x03:
+                        self.status = self.COMPLETE
+                    else:
+                        self._state = self._TYPE
+
+        if self.status != self.NEED_MORE:
+            self.needed = 0
+        elif self._state == self._VALUE:
+            # 非 NDEF TLV 的值之后至少还需要下一个 TLV 的类型字节
+            self.needed = self._remaining + (0 if self._type == 0x03 else 1)
+        elif self._state == self._LENGTH16:
+            self.needed = self._remaining
+        else:
+            self.needed = 1
+        return self.status
+
+
+@micropython.native  # (V39) 优化: 编译为本地字节码
+def decode_ndef_text(message):
+    """
+    从 NDEF 消息中取出第一个文本 (TextRecord)。
+    只解析记录头，前面的 URI 等记录不会被解码。
+    """
+    if ndef is None or message is None: return None
+
+    try:
+        for view in ndef.record_views(message, NDEF_TEXT_TYPES):
+            record = view.decode()
+            if config.DEBUG: print(f"    >>> 找到文本: {record.text}")
+            return record.text
+        if config.DEBUG: print("  [!] NDEF 消息中没有文本记录。")
     except Exception as e:
         print(f"  [!] 解析 NDEF 失败 (错误类型: {type(e).__name__}): {e}")
     return None
 
 
-def read_ultralight_ndef(rdr):
+def parse_ndef_message(raw_data):
     """
-    读取 NTAG/Ultralight 标签的 NDEF 数据。
+    从原始页数据中解析 NDEF 消息。
+    """
+    if config.DEBUG: print("  [.] 正在解析 NDEF 数据...")
+    parser = TLVStreamParser(len(raw_data))
+    if parser.feed(raw_data) != parser.COMPLETE or parser.message is None:
+        if config.DEBUG: print("  [!] 遍历了所有 TLV，未找到完整的 NDEF 消息 (Type 0x03)。")
+        return None
+    return decode_ndef_text(parser.message)
+
+
+def encode_tag_image(records, buf, capacity=NTAG213_DATA_AREA):
+    """
+    把 NDEF 记录编码为 Type 2 标签数据区镜像 (自 Page 4 起)，直接写入调用方提供的
+    bytearray: NDEF Message TLV (0x03，长度 < 0xFF 用 1 字节，否则 0xFF + 2 字节)、
+    记录本身和 Terminator TLV (0xFE)，最后一页剩余字节补 0。
+    返回已用字节数 (含 Terminator)。镜像超出 capacity (标签数据区) 或 buf 时
+    在写入任何字节之前抛出 ndef.record.EncodeError。
+    """
+    prepared = ndef.PreparedMessage(records)
+    length = prepared.length
+    header = 2 if length < 0xFF else 4
+    used = header + length + 1
+    if used > capacity or used > len(buf):
+        raise ndef.record.EncodeError(
+            f"标签镜像 {used} 字节超出数据区 ({min(capacity, len(buf))} 字节)")
+
+    buf[0] = 0x03
+    if header == 2:
+        buf[1] = length
+    else:
+        buf[1] = 0xFF
+        buf[2] = length >> 8
+        buf[3] = length & 0xFF
+    prepared.encode_into(buf, header)
+    buf[used - 1] = 0xFE
+    for i in range(used, min(len(buf), (used + 3) & ~3)):
+        buf[i] = 0
+    return used
+
+
+def failure_stats(reader_obj):
+    """返回读卡器 (槽位) 的读取失败统计: 失败类别 -> 次数，另有 'aborts' 为放弃读取的次数。"""
+    stats = _failure_stats.get(id(reader_obj))
+    if stats is None:
+        stats = _failure_stats[id(reader_obj)] = {}
+    return stats
+
+
+async def read_pages(rdr, start_page, end_page):
+    """
+    (Async) 用 FAST_READ 读取 start_page..end_page (含)，每块最多 FAST_READ_MAX_PAGES 页。
+    失败按驱动报告的类别 (无应答/CRC/NAK/冲突) 查 NFC_READ_RETRY_POLICY 决定重试次数和
+    退避时间 (每次重试翻倍)，退避期间让出调度器。NAK 后标签回到 IDLE/HALT，
+    重试前先重新唤醒并选中。无应答默认不重试: 标签已离开时立即放弃，不在剩余页上浪费重试。
+    返回读到的字节，任一块最终失败时返回 None。
     """
-    if config.DEBUG: print("  [.] 正在读取 NTAG/Ultralight NDEF...")
     all_data = bytearray()
-    pages_to_read = []
-    for i in range(11):
-        pages_to_read.append(0x04 + (i * 4)) 
-        
-    for page_addr in pages_to_read:
-        data = None
-        for retry in range(3):
-            data = rdr.read(page_addr)
+    chunk_pages = rdr.FAST_READ_MAX_PAGES
+    stats = failure_stats(rdr)
+
+    for chunk_start in range(start_page, end_page + 1, chunk_pages):
+        chunk_end = min(end_page, chunk_start + chunk_pages - 1)
+        attempt = 0
+        while True:
+            data = await rdr.fast_read_async(chunk_start, chunk_end)
             if data:
                 break
-            else:
-                if config.DEBUG: print(f"    - 读取块 {page_addr} 失败 (尝试 {retry+1}/3)")
-                time.sleep_ms(10)
-        if data:
-            all_data.extend(data)
-        else:
-            print(f"  [!] 读取 Page {page_addr} 彻底失败 (已重试 3 次)。")
-            break # 停止读取
-            
-    if not all_data:
+            failure = rdr.last_failure or rdr.FAIL_OTHER
+            stats[failure] = stats.get(failure, 0) + 1
+            (retries, backoff_ms) = config.NFC_READ_RETRY_POLICY.get(failure, (0, 0))
+            if attempt >= retries:
+                stats['aborts'] = stats.get('aborts', 0) + 1
+                if config.DEBUG: print(f"  [!] 读取 Page {chunk_start}-{chunk_end} 失败 ({failure})，放弃读取。")
+                return None
+            attempt += 1
+            if config.DEBUG: print(f"    - 读取 Page {chunk_start}-{chunk_end} 失败 ({failure})，重试 {attempt}/{retries}")
+            await uasyncio.sleep_ms(backoff_ms << (attempt - 1))
+            if failure == rdr.FAIL_NAK:
+                (stat, _) = await rdr.wakeup_async()
+                if stat != rdr.OK or (await rdr.select_card_async())[0] != rdr.OK:
+                    stats['aborts'] = stats.get('aborts', 0) + 1
+                    return None
+        all_data.extend(data)
+
+    return all_data
+
+
+async def read_ultralight_ndef(rdr):
+    """
+    (Async) 读取 NTAG/Ultralight 标签的 NDEF 数据。
+    先读取 Page 3 (Capability Container) 和数据区开头，然后把每次读到的页块
+    交给 TLVStreamParser，只按解析器报告的缺少字节数继续读取；NDEF 消息完整或
+    遇到 Terminator TLV 后立即停止，剩余页不再读取。
+    """
+    if config.DEBUG: print("  [.] 正在读取 NTAG/Ultralight NDEF...")
+    head = await read_pages(rdr, 0x03, 0x03 + NDEF_HEAD_PAGES)
+    if head is None or len(head) < 8:
         if config.DEBUG: print("  [!] 未能从标签读取任何数据。")
         return None
-        
-    if config.DEBUG: print(f"  [+] 总共读取 {len(all_data)} 字节的原始数据。")
-    
-    if len(all_data) > 0:
-        return parse_ndef_message(all_data)
-    else:
+
+    if head[0] != 0xE1:
+        if config.DEBUG: print(f"  [!] CC 魔数无效 (0x{head[0]:02X})，标签未格式化为 NDEF。")
+        return None
+    data_area_size = head[2] * 8
+    if config.DEBUG: print(f"  [.] CC: NDEF 版本 0x{head[1]:02X}，数据区 {data_area_size} 字节")
+
+    parser = TLVStreamParser(data_area_size)
+    status = parser.feed(memoryview(head)[4:])
+    read_bytes = len(head) - 4
+    while status == parser.NEED_MORE and read_bytes < data_area_size:
+        target = min(read_bytes + parser.needed, data_area_size)
+        start_page = 0x04 + read_bytes // 4
+        end_page = 0x04 + (target + 3) // 4 - 1
+        data = await read_pages(rdr, start_page, end_page)
+        if data is None:
+            break
+        read_bytes += len(data)
+        status = parser.feed(data)
+
+    if config.DEBUG: print(f"  [+] 总共读取 {read_bytes} 字节的原始数据。")
+    if status != parser.COMPLETE or parser.message is None:
+        if config.DEBUG: print("  [!] 未找到完整的 NDEF 消息 (Type 0x03)。")
         return None
+    return decode_ndef_text(parser.message)
+
+
+async def write_ultralight_ndef(rdr, records):
+    """
+    (Async) 把 NDEF 记录写入已选中的 NTAG/Ultralight 标签。
+    先读取 CC 和当前数据区镜像，只对与新镜像不同的 4 字节页执行 WRITE (0xA2)，
+    最后用一次多页读取回读校验。返回 (WRITE_* 结果, 写入页数)。
+    """
+    head = await read_pages(rdr, 0x03, 0x03 + NDEF_HEAD_PAGES)
+    if head is None or len(head) < 8:
+        return WRITE_READ_FAILED, 0
+    if head[0] != 0xE1:
+        if config.DEBUG: print(f"  [!] CC 魔数无效 (0x{head[0]:02X})，标签未格式化为 NDEF。")
+        return WRITE_NOT_NDEF, 0
+    if head[3] != 0x00:
+        if config.DEBUG: print(f"  [!] 标签只读 (CC 写权限 0x{head[3]:02X})。")
+        return WRITE_READ_ONLY, 0
+
+    image = bytearray(head[2] * 8)
+    try:
+        used = encode_tag_image(records, image, len(image))
+    except ndef.record.EncodeError as e:
+        if config.DEBUG: print(f"  [!] {e}")
+        return WRITE_TOO_LARGE, 0
+    pages = (used + 3) // 4
+
+    current = head[4:]
+    if len(current) < pages * 4:
+        rest = await read_pages(rdr, 0x04 + len(current) // 4, 0x04 + pages - 1)
+        if rest is None:
+            return WRITE_READ_FAILED, 0
+        current.extend(rest)
+
+    invalidate_tag_cache(rdr)
+    written = 0
+    for i in range(pages):
+        off = i * 4
+        if image[off:off + 4] == current[off:off + 4]:
+            continue
+        if await rdr.write_page_async(0x04 + i, memoryview(image)[off:off + 4]) != rdr.OK:
+            print(f"  [!] 写入 Page {0x04 + i} 失败。")
+            return WRITE_FAILED, written
+        written += 1
+
+    if config.DEBUG: print(f"  [+] 已写入 {written}/{pages} 页，正在校验...")
+    check = await read_pages(rdr, 0x04, 0x04 + pages - 1)
+    if check is None or check[:pages * 4] != image[:pages * 4]:
+        return WRITE_VERIFY_FAILED, written
+    return WRITE_OK, written
 
 
-def read_tag_text(reader_obj):
+def invalidate_tag_cache(reader_obj=None):
     """
-    尝试从 MFRC522 读卡器实例中读取单个 NDEF 文本。
+    清除 UID 缓存，使下一次轮询强制完整读取 NDEF。
+    不传参数时清除所有槽位。
     """
+    if reader_obj is None:
+        _tag_cache.clear()
+    else:
+        _tag_cache.pop(id(reader_obj), None)
+
+
+async def read_tag_text(reader_obj, revalidate=False):
+    """
+    (Async) 尝试从 MFRC522 读卡器实例中读取单个 NDEF 文本。
+    等待射频收发时让出调度器，不阻塞其他异步任务。
+    用 WUPA 唤醒标签 (包括上一轮被 HLTA 休眠的标签)，处理完后再用 HLTA 让它休眠。
+    先只做 CL1 防冲突: 应答 (CT/UID0-2 + BCC) 与缓存一致且缓存未超过 NFC_CACHE_REVALIDATE_MS 时，
+    即可确认标签仍在，直接 HLTA 并返回缓存文本，不做 SELECT 和页读取。
+    否则 (新标签、缓存过期或 revalidate=True) 走完所有级联级别的 SELECT，
+    得到完整的 4/7/10 字节 UID 和 SAK 后完整读取。
+    WUPA 无应答即视为标签已移除。
+    整个 唤醒 -> 读取 -> 休眠 过程持有读卡器的 exchange 锁，不会与编程站或校准交错。
+    """
+    async with reader_obj.exchange:
+        return await _read_tag_text(reader_obj, revalidate)
+
+
+async def _read_tag_text(reader_obj, revalidate):
     detected_text = None
-    (stat, tag_type) = reader_obj.request(reader_obj.REQIDL)
+    (stat, tag_type) = await reader_obj.wakeup_async()
     if stat != reader_obj.OK:
         return None
         
-    (stat, raw_uid) = reader_obj.anticoll()
+    (stat, cl1) = await reader_obj.anticoll_async()
     if stat != reader_obj.OK:
         return None
-        
-    if reader_obj.select_tag(raw_uid) == reader_obj.OK:
-        detected_text = read_ultralight_ndef(reader_obj)
-        if detected_text:
-            return detected_text.strip()
-            
-    return None
\ No newline at end of file
+
+    cache_key = id(reader_obj)
+    cached = _tag_cache.get(cache_key)
+    if (cached is not None and not revalidate and cached[1] == cl1
+            and time.ticks_diff(time.ticks_ms(), cached[3]) < config.NFC_CACHE_REVALIDATE_MS):
+        if config.DEBUG: print(f"  [.] UID {ubinascii.hexlify(cached[0]).decode()} 未变化，使用缓存")
+        # 标签停在 READY*: HLTA 不是它期待的命令，同样会让它回到 HALT
+        await reader_obj.halt_async()
+        return cached[2]
+
+    (stat, uid, sak) = await reader_obj.select_card_async(cl1)
+    if stat != reader_obj.OK:
+        return None
+
+    tag_type = reader_obj.tag_type(sak)
+    if tag_type == reader_obj.TAG_TYPE2:
+        detected_text = await read_ultralight_ndef(reader_obj)
+    elif config.DEBUG:
+        print(f"  [!] 不支持的标签类型 {tag_type} (SAK 0x{sak:02X})，UID {ubinascii.hexlify(uid).decode()}")
+    await reader_obj.halt_async()
+    if detected_text:
+        detected_text = detected_text.strip()
+        _tag_cache[cache_key] = (uid, bytes(cl1), detected_text, time.ticks_ms())
+        return detected_text
+
+    _tag_cache.pop(cache_key, None)
+    return None
@@ -0,0 +1,52 @@
+try:
+    from time import ticks_add, ticks_diff
+except ImportError:  # CPython: 主机上测试调度器
+    def ticks_add(a, b):
+        return a + b
+
+    def ticks_diff(a, b):
+        return a - b
+
+
+class PollScheduler:
+    """
+    每个槽位独立的轮询间隔。
+    状态变化或疑似移除 (SUSPECT) 后间隔回到当前档位的下限 (floor)，
+    之后每次无变化的轮询间隔翻倍，直到上限 (ceiling)。
+    档位 (profile) 由打印机状态切换，例如换料时 (200, 1000)、打印中 (5000, 30000)。
+    只计算时间，不访问硬件，可在主机上直接测试。
+    """
+
+    def __init__(self, slot_count, profiles, profile, now_ms):
+        self.profiles = profiles
+        self.profile = profile
+        self.floor, self.ceiling = profiles[profile]
+        self._interval = [self.floor] * slot_count
+        self._due = [now_ms] * slot_count
+
+    def set_profile(self, profile, now_ms):
+        """切换档位，返回是否有变化。已排定的轮询不会晚于新档位的上限。"""
+        if profile == self.profile or profile not in self.profiles:
+            return False
+        self.profile = profile
+        self.floor, self.ceiling = self.profiles[profile]
+        for i in range(len(self._due)):
+            interval = min(max(self._interval[i], self.floor), self.ceiling)
+            self._interval[i] = interval
+            latest = ticks_add(now_ms, interval)
+            if ticks_diff(self._due[i], latest) > 0:
+                self._due[i] = latest
+        return True
+
+    def record(self, i, now_ms, changed, suspect):
+        """记录槽位 i 的一次轮询结果并排定下一次轮询。"""
+        if changed or suspect:
+            interval = self.floor
+        else:
+            interval = min(self._interval[i] * 2, self.ceiling)
+        self._interval[i] = interval
+        self._due[i] = ticks_add(now_ms, interval)
+
+    def sleep_ms(self, i, now_ms):
+        """距离槽位 i 下一次轮询的毫秒数 (不小于 0)。"""
+        return max(0, ticks_diff(self._due[i], now_ms))
@@ -0,0 +1,72 @@
+try:
+    from time import ticks_diff
+except ImportError:  # CPython: 主机上测试状态机
+    def ticks_diff(a, b):
+        return a - b
+
+
+class SlotState:
+    """
+    单个槽位的标签状态机，按经过时间和射频结果去抖，与轮询次数无关。
+
+    EMPTY            槽位为空
+    PRESENT          标签在位，text 为其耗材 ID
+    SUSPECT_REMOVED  在位标签没有应答: 需要立即突发重探测，
+                     在 confirm_ms 确认窗口内一直无应答 (且至少 min_misses 次) 才判定移除
+    SWAPPED          读到与当前不同的 ID (换了料盘): 立即发布，下一次更新回到 PRESENT
+
+    update() 只接收读取结果和当前 ticks_ms，不访问硬件，可在主机上直接测试。
+    返回需要发布的新值 (ID 或空字符串 "")，无变化时返回 None。
+    """
+
+    EMPTY = 0
+    PRESENT = 1
+    SUSPECT_REMOVED = 2
+    SWAPPED = 3
+
+    def __init__(self, confirm_ms=3000, min_misses=3):
+        self.confirm_ms = confirm_ms
+        self.min_misses = min_misses
+        self.state = self.EMPTY
+        self.text = ""
+        self.misses = 0
+        self._suspect_since = 0
+        self._published = False
+
+    @property
+    def suspect(self):
+        return self.state == self.SUSPECT_REMOVED
+
+    def update(self, text, now_ms):
+        if not self._published:
+            # 首次结果无论有无标签都发布，完成初始化
+            self._published = True
+            self.state = self.PRESENT if text else self.EMPTY
+            self.text = text or ""
+            return self.text
+
+        if text:
+            self.misses = 0
+            if text == self.text and self.state != self.EMPTY:
+                self.state = self.PRESENT
+                return None
+            self.state = self.SWAPPED if self.state != self.EMPTY else self.PRESENT
+            self.text = text
+            return text
+
+        if self.state == self.EMPTY:
+            return None
+        if self.state != self.SUSPECT_REMOVED:
+            self.state = self.SUSPECT_REMOVED
+            self._suspect_since = now_ms
+            self.misses = 1
+            return None
+
+        self.misses += 1
+        if (self.misses >= self.min_misses
+                and ticks_diff(now_ms, self._suspect_since) >= self.confirm_ms):
+            self.state = self.EMPTY
+            self.text = ""
+            self.misses = 0
+            return ""
+        return None
@@ -0,0 +1,71 @@
+from machine import Pin, SPI
+from os import uname
+
+
+class SPIBus:
+    """
+    多个 SPI 设备共享的总线: 只创建一次 SPI 外设，管理每个设备的片选 (CS)，
+    并在切换设备时按设备的 baudrate 重新配置时钟。
+
+    并发约定:
+    - transfer() 是同步函数，一次完整的 CS 拉低 -> (切换时钟) -> 传输 -> CS 拉高之间没有 await。
+      在 uasyncio 的协作式调度下它是原子的，不同设备的传输不会在总线上交错。
+      因此总线本身不带锁；transfer() 内部也不能加入 await，否则这一保证失效。
+    - 多个寄存器组成的操作 (一次收发、唤醒 -> 读取 -> 休眠) 之间会 await，
+      由每个读卡器自己的 MFRC522.exchange 锁串行化，这是唯一的串行化点。
+      不同读卡器的操作可以在 await 处交错，它们只共享 SPI 外设，不共享芯片状态。
+    """
+
+    DEFAULT_BAUDRATE = 100000
+
+    def __init__(self, sck, mosi, miso, spi_id=1, baudrate=DEFAULT_BAUDRATE):
+
+        self.sck = Pin(sck, Pin.OUT)
+        self.mosi = Pin(mosi, Pin.OUT)
+        self.miso = Pin(miso)
+        self.owner = None
+        self.baudrate = baudrate
+        self._cs = {}
+
+        board = uname()[0]
+
+        if board == 'WiPy' or board == 'LoPy' or board == 'FiPy':
+            self.spi = SPI(0)
+            self.spi.init(SPI.MASTER, baudrate=baudrate, pins=(self.sck, self.mosi, self.miso))
+        elif board == 'esp8266' or board == 'esp32':
+            self.spi = SPI(spi_id, baudrate=baudrate, polarity=0, phase=0, sck=self.sck, mosi=self.mosi, miso=self.miso)
+        else:
+            raise RuntimeError("Unsupported platform")
+
+    def attach(self, device, cs):
+        """登记设备及其片选引脚 (空闲为高电平)。设备需提供 baudrate 属性。"""
+        pin = Pin(cs, Pin.OUT)
+        pin.value(1)
+        self._cs[id(device)] = pin
+
+    def claim(self, device):
+        """
+        切换到设备: 如果时钟频率与当前不同则重新配置 SPI。
+        由 transfer 在设备的首次传输前自动调用。
+        """
+        if device.baudrate != self.baudrate:
+            self.spi.init(baudrate=device.baudrate)
+            self.baudrate = device.baudrate
+        self.owner = device
+
+    def release(self, device):
+        """设备修改自身参数后调用，使下一次传输重新应用设备设置。"""
+        if self.owner is device:
+            self.owner = None
+
+    def transfer(self, device, tx, rx=None):
+        """选中设备并发送 tx；给出 rx 时同时把读到的字节写入 rx。"""
+        if self.owner is not device:
+            self.claim(device)
+        cs = self._cs[id(device)]
+        cs.value(0)
+        if rx is None:
+            self.spi.write(tx)
+        else:
+            self.spi.write_readinto(tx, rx)
+        cs.value(1)
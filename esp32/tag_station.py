@@ -0,0 +1,153 @@
+import time
+import ubinascii
+import ujson
+
+import config
+import network_manager
+import nfc_reader
+
+try:
+    from ndef.text import TextRecord
+except ImportError as e:
+    print(f"!!!!! 错误: 缺少 NDEF 库，标签编程站不可用: {e} !!!!!")
+    TextRecord = None
+
+# --- 模块全局变量 ---
+# 编程站槽位 (从 1 开始)，0 表示未启用
+_slot = 0
+# 待写入的耗材 ID 队列
+_queue = []
+# 本批次已写入成功的标签 UID，同一张标签不会被写第二次
+_done_uids = set()
+# 当前放在编程站上的标签 UID；处理过后需先拿开才会再次尝试
+_present_uid = None
+
+_command_topic = None
+_result_topic = None
+_state_topic = None
+
+
+def init(config_data):
+    """
+    订阅编程站命令 topic ({nfc_mqtt_topic_base}/program)。
+    命令为 JSON:
+      {"slot": 2, "ids": ["PLA-001", "PLA-002"]}  启用槽位 2 并把 ID 追加到队列
+      {"slot": 2, "ids": "PLA-003"}               单个 ID 也可以直接给字符串
+      {"slot": 0} 或 {"stop": true}                 停止编程站并清空队列
+    每张标签的结果发布到 .../program/result，队列状态发布到 .../program/state。
+    """
+    global _command_topic, _result_topic, _state_topic
+    base = config_data.get("nfc_mqtt_topic_base", "ams_sensor/nfc")
+    _command_topic = f"{base}/program"
+    _result_topic = f"{base}/program/result"
+    _state_topic = f"{base}/program/state"
+    network_manager.subscribe_mqtt(_command_topic, _on_command)
+
+
+def active_slot():
+    """返回当前作为编程站的槽位 (从 1 开始)，未启用时返回 0。"""
+    return _slot
+
+
+def stop():
+    """停止编程站并清空队列，槽位恢复正常轮询。"""
+    global _slot, _present_uid
+    _slot = 0
+    _queue.clear()
+    _done_uids.clear()
+    _present_uid = None
+    _publish_state()
+
+
+def _publish_state():
+    network_manager.try_publish_mqtt(
+        _state_topic, ujson.dumps({"slot": _slot, "pending": len(_queue)}))
+
+
+def _on_command(topic, msg):
+    global _slot
+    try:
+        command = ujson.loads(msg)
+    except ValueError:
+        print(f"  [!] 编程站命令不是有效的 JSON: {msg}")
+        return
+
+    if command.get("stop") or command.get("slot") == 0:
+        if config.DEBUG: print("  [.] 编程站已停止")
+        stop()
+        return
+
+    ids = command.get("ids", [])
+    if isinstance(ids, str):
+        ids = [ids]
+    elif not isinstance(ids, list):
+        print(f"  [!] 编程站命令的 ids 必须是列表: {ids}")
+        return
+
+    slot = int(command.get("slot", _slot))
+    if slot < 1 or slot > len(config.READER_PINS):
+        print(f"  [!] 编程站槽位 {slot} 无效")
+        return
+    if slot != _slot:
+        _done_uids.clear()
+    _slot = slot
+    for spool_id in ids:
+        _queue.append(str(spool_id))
+    if config.DEBUG: print(f"  [.] 编程站: Slot {_slot}，待写入 {len(_queue)} 个 ID")
+    _publish_state()
+
+
+async def step(readers):
+    """
+    (Async) 编程站的一次轮询: 检测编程站槽位上新放上的标签，写入队首 ID 并发布结果。
+    只占用编程站所在的读卡器，其他槽位的轮询照常进行。
+    持有该读卡器的 exchange 锁，槽位任务正在进行的读取会先完成。
+    """
+    if not _slot or not _queue or TextRecord is None or _slot > len(readers):
+        return
+
+    rdr = readers[_slot - 1]
+    async with rdr.exchange:
+        await _step(rdr)
+
+
+async def _step(rdr):
+    global _present_uid
+    # 用 WUPA: 槽位任务在切换为编程站之前可能已把标签 HLTA 休眠，REQA 会漏掉它；
+    # 已处理的标签靠 _present_uid / _done_uids 跳过
+    (stat, _) = await rdr.wakeup_async()
+    if stat != rdr.OK:
+        _present_uid = None
+        return
+    start_ms = time.ticks_ms()
+    (stat, uid, sak) = await rdr.select_card_async()
+    if stat != rdr.OK:
+        return
+    if uid == _present_uid or uid in _done_uids:
+        await rdr.halt_async()
+        return
+    _present_uid = uid
+
+    spool_id = _queue[0]
+    if rdr.tag_type(sak) == rdr.TAG_TYPE2:
+        (status, pages) = await nfc_reader.write_ultralight_ndef(rdr, [TextRecord(spool_id)])
+    else:
+        (status, pages) = (nfc_reader.WRITE_NOT_NDEF, 0)
+    await rdr.halt_async()
+    duration_ms = time.ticks_diff(time.ticks_ms(), start_ms)
+
+    uid_hex = ubinascii.hexlify(uid).decode()
+    print(f"  [{'+' if status == nfc_reader.WRITE_OK else '!'}] 编程站: {uid_hex} <- '{spool_id}': {status} ({pages} 页, {duration_ms}ms)")
+    if status == nfc_reader.WRITE_OK:
+        _queue.pop(0)
+        _done_uids.add(uid)
+
+    network_manager.try_publish_mqtt(_result_topic, ujson.dumps({
+        "slot": _slot,
+        "uid": uid_hex,
+        "id": spool_id,
+        "status": status,
+        "pages": pages,
+        "ms": duration_ms,
+    }), retain=False)
+    _publish_state()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 纯逻辑模块 (slot_state, poll_scheduler) 在 CPython 上有 ticks 回退实现，可直接导入
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "esp32"))
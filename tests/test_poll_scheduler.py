@@ -0,0 +1,95 @@
+from poll_scheduler import PollScheduler
+
+# 与 config.NFC_POLL_PROFILES 相同的结构: 打印机状态 -> (floor, ceiling)
+PROFILES = {
+    "idle": (500, 5000),
+    "printing": (5000, 30000),
+    "changing_filament": (200, 1000),
+}
+
+
+def make_scheduler(profile="idle", slots=2):
+    return PollScheduler(slots, PROFILES, profile, 0)
+
+
+def test_first_poll_is_due_immediately():
+    scheduler = make_scheduler()
+    assert scheduler.sleep_ms(0, 0) == 0
+    assert scheduler.sleep_ms(1, 0) == 0
+
+
+def test_profile_selects_floor_and_ceiling():
+    for profile, (floor, ceiling) in PROFILES.items():
+        scheduler = make_scheduler(profile)
+        assert (scheduler.floor, scheduler.ceiling) == (floor, ceiling)
+        scheduler.record(0, 0, True, False)
+        assert scheduler.sleep_ms(0, 0) == floor
+
+
+def test_unchanged_polls_back_off_to_ceiling():
+    scheduler = make_scheduler()
+    now = 0
+    intervals = []
+    for _ in range(6):
+        scheduler.record(0, now, False, False)
+        interval = scheduler.sleep_ms(0, now)
+        intervals.append(interval)
+        now += interval
+    assert intervals == [1000, 2000, 4000, 5000, 5000, 5000]
+
+
+def test_change_or_suspect_resets_to_floor():
+    scheduler = make_scheduler()
+    for now in (0, 1000, 3000, 7000):
+        scheduler.record(0, now, False, False)
+    assert scheduler.sleep_ms(0, 7000) == 5000
+
+    # 读到新 ID (changed)
+    scheduler.record(0, 12000, True, False)
+    assert scheduler.sleep_ms(0, 12000) == 500
+
+    scheduler.record(0, 12500, False, False)
+    assert scheduler.sleep_ms(0, 12500) == 1000
+
+    # 在位标签读取失败 (suspect)
+    scheduler.record(0, 13500, False, True)
+    assert scheduler.sleep_ms(0, 13500) == 500
+
+
+def test_slots_are_scheduled_independently():
+    scheduler = make_scheduler()
+    scheduler.record(0, 0, False, False)
+    scheduler.record(1, 0, True, False)
+    assert scheduler.sleep_ms(0, 0) == 1000
+    assert scheduler.sleep_ms(1, 0) == 500
+
+
+def test_set_profile_caps_pending_polls_to_new_ceiling():
+    scheduler = make_scheduler("printing")
+    scheduler.record(0, 0, False, False)
+    assert scheduler.sleep_ms(0, 0) == 10000
+
+    assert scheduler.set_profile("changing_filament", 100)
+    assert (scheduler.floor, scheduler.ceiling) == (200, 1000)
+    assert scheduler.sleep_ms(0, 100) == 1000
+    scheduler.record(0, 1100, False, False)
+    assert scheduler.sleep_ms(0, 1100) == 1000
+
+
+def test_set_profile_raises_interval_to_new_floor():
+    scheduler = make_scheduler("idle")
+    scheduler.record(0, 0, True, False)
+
+    assert scheduler.set_profile("printing", 100)
+    # 已排定的轮询不推迟，之后的间隔从新档位的下限开始翻倍
+    assert scheduler.sleep_ms(0, 100) == 400
+    scheduler.record(0, 500, False, False)
+    assert scheduler.sleep_ms(0, 500) == 10000
+
+
+def test_set_profile_ignores_same_or_unknown_profile():
+    scheduler = make_scheduler("idle")
+    assert not scheduler.set_profile("idle", 0)
+    assert not scheduler.set_profile("paused", 0)
+    assert scheduler.profile == "idle"
+    assert (scheduler.floor, scheduler.ceiling) == (500, 5000)
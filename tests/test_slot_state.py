@@ -0,0 +1,87 @@
+from slot_state import SlotState
+
+
+def make_state():
+    # 时间全部由测试注入 (now_ms)，与 ticks_ms 无关
+    return SlotState(confirm_ms=3000, min_misses=3)
+
+
+def test_first_read_publishes_present():
+    state = make_state()
+    assert state.update("PLA-001", 0) == "PLA-001"
+    assert state.state == SlotState.PRESENT
+    assert state.text == "PLA-001"
+
+
+def test_first_read_empty_publishes_empty():
+    state = make_state()
+    assert state.update(None, 0) == ""
+    assert state.state == SlotState.EMPTY
+    assert state.update(None, 100) is None
+
+
+def test_short_miss_burst_stays_present():
+    state = make_state()
+    state.update("PLA-001", 0)
+
+    assert state.update(None, 1000) is None
+    assert state.suspect
+    assert state.update(None, 1050) is None
+    assert state.update(None, 1100) is None
+    # 已达到 min_misses，但还在确认窗口内
+    assert state.state == SlotState.SUSPECT_REMOVED
+
+    assert state.update("PLA-001", 1150) is None
+    assert state.state == SlotState.PRESENT
+    assert state.misses == 0
+
+
+def test_suspect_removed_becomes_empty_after_confirm_window():
+    state = make_state()
+    state.update("PLA-001", 0)
+
+    assert state.update(None, 1000) is None
+    assert state.update(None, 1050) is None
+    assert state.update(None, 1100) is None
+    assert state.update(None, 3999) is None
+    assert state.update(None, 4000) == ""
+    assert state.state == SlotState.EMPTY
+    assert state.text == ""
+    assert state.update(None, 5000) is None
+
+
+def test_confirm_window_needs_min_misses():
+    state = make_state()
+    state.update("PLA-001", 0)
+
+    # 一次无应答后很久才再次轮询: 时间够了，次数不够
+    assert state.update(None, 1000) is None
+    assert state.update(None, 9000) is None
+    assert state.update(None, 9050) == ""
+
+
+def test_different_id_is_swapped():
+    state = make_state()
+    state.update("PLA-001", 0)
+
+    assert state.update("PETG-002", 500) == "PETG-002"
+    assert state.state == SlotState.SWAPPED
+    assert state.update("PETG-002", 1000) is None
+    assert state.state == SlotState.PRESENT
+
+
+def test_new_id_while_suspect_is_swapped():
+    state = make_state()
+    state.update("PLA-001", 0)
+    state.update(None, 100)
+
+    assert state.update("PETG-002", 200) == "PETG-002"
+    assert state.state == SlotState.SWAPPED
+
+
+def test_tag_placed_on_empty_slot_is_present():
+    state = make_state()
+    state.update(None, 0)
+
+    assert state.update("PLA-001", 100) == "PLA-001"
+    assert state.state == SlotState.PRESENT